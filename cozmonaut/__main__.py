@@ -15,12 +15,78 @@ Options:
     --version       Show version information.
 """
 
-import time
-
-from docopt import docopt
+import sys
 
 from cozmonaut import __version__
-from cozmonaut.operation.interact import InteractInterface, OperationInteract
+
+# Map of interact options to their docopt result keys
+_INTERACT_OPTIONS = {
+    '-a': '<sera>',
+    '-b': '<serb>',
+    '--robot-a': '--robot-a',
+    '--robot-b': '--robot-b',
+}
+
+
+def parse_args_fast(argv: list):
+    """
+    Parse command-line arguments for the common cases without docopt.
+
+    This only understands the help, version, and interact usages. Anything else
+    (including anything malformed) is left for docopt to handle.
+
+    :param argv: The command-line arguments (without the program name)
+    :return: A dict shaped like docopt's result or None to defer to docopt
+    """
+
+    # Show help and version information ourselves
+    if argv == ['-h'] or argv == ['--help']:
+        print(__doc__.strip('\n'))
+        exit(0)
+    elif argv == ['--version']:
+        print(__version__)
+        exit(0)
+
+    # Everything else we handle is an interact command
+    if argv[:1] != ['interact']:
+        return None
+
+    args = {
+        'interact': True,
+        '<sera>': None,
+        '<serb>': None,
+        '--robot-a': None,
+        '--robot-b': None,
+    }
+
+    # Go over the interact options
+    rest = iter(argv[1:])
+    for arg in rest:
+        # Split off an inline value (e.g. --robot-a=<sera>)
+        name, eq, value = arg.partition('=')
+
+        # Look up the result key for the option
+        key = _INTERACT_OPTIONS.get(name)
+
+        # Defer on unknown options, repeated options, or inline values on short options
+        if key is None or args[key] is not None or (eq and not name.startswith('--')):
+            return None
+
+        # Take the value from the next argument if not inline
+        if not eq:
+            value = next(rest, None)
+
+        # Defer on missing values
+        if not value:
+            return None
+
+        args[key] = value
+
+    # Defer if a robot was given twice
+    if (args['<sera>'] and args['--robot-a']) or (args['<serb>'] and args['--robot-b']):
+        return None
+
+    return args
 
 
 def do_interact(sera: str, serb: str):
@@ -31,6 +97,9 @@ def do_interact(sera: str, serb: str):
     :param serb: Serial number for robot B or None to ignore it
     """
 
+    # Only pull in the robot stack when we need it
+    from cozmonaut.operation.interact import InteractInterface, OperationInteract
+
     # Arguments for interaction
     args = {}
 
@@ -84,7 +153,12 @@ def do_interact(sera: str, serb: str):
 
 if __name__ == '__main__':
     # Parse command-line arguments
-    args = docopt(__doc__, version=__version__)
+    # Common invocations skip docopt (and its import) entirely
+    args = parse_args_fast(sys.argv[1:])
+    if args is None:
+        from docopt import docopt
+
+        args = docopt(__doc__, version=__version__)
 
     if args['interact']:
         # Do interactive mode
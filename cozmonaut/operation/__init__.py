@@ -3,37 +3,37 @@
 # Copyright 2019 The Cozmonaut Contributors
 #
 
-from abc import abstractmethod, ABC
+from threading import Event
 
 
-class Operation(ABC):
+class Operation:
     """
-    An abstract operation.
+    A base operation.
+
+    Subclasses must override start, stop, and is_running.
     """
 
-    @abstractmethod
     def __init__(self, args: dict):
-        pass
+        # Set when the operation is done (thread-safe)
+        # This goes set even if the operation naturally dies
+        self._done = Event()
 
-    @abstractmethod
     def start(self):
         """
         Start the operation.
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def stop(self):
         """
         Stop the operation.
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     def is_running(self):
         """
         Check if the operation is running.
 
         :return: True if such is the case, otherwise False
         """
-        return False
+        raise NotImplementedError
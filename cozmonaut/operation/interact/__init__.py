@@ -5,26 +5,94 @@
 
 import argparse
 import asyncio
-import functools
+import base64
 import json
+import logging
 import math
-import queue
 import random
 import time
-from enum import Enum
+from concurrent.futures import ThreadPoolExecutor
+from enum import Enum, IntEnum
 from threading import Lock, Thread
-from typing import Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 
 import cmd2
 import cozmo
+import numpy
 from PIL import Image, ImageDraw
 
+# Use uvloop for the event loop if it's installed
+# It's optional, as the stock event loop works just fine (only a bit slower)
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 from cozmonaut.operation import Operation
 from cozmonaut.operation.interact import database
 from cozmonaut.operation.interact.service.convo import ServiceConvo
 from cozmonaut.operation.interact.service.face import DetectedFace, RecognizedFace, ServiceFace
 
 
+# The logger for routine progress details
+# These are too chatty for the terminal, so they only show up if logging is configured
+_log = logging.getLogger(__name__)
+
+# Common motion parameters
+# These are immutable, so we build them once and share them between all trips and activities
+
+# Head angle for looking straight ahead (e.g. to see the charger)
+_HEAD_LEVEL = cozmo.util.degrees(0)
+
+# Head angle for showing the pong game on the face
+_PONG_HEAD_ANGLE = cozmo.util.degrees(45)
+
+# A half turn (e.g. to face the charger or the other Cozmo)
+_TURN_AROUND = cozmo.util.degrees(180)
+
+# Tolerance on turning our back to the charger before backing onto it
+_PARK_TURN_TOLERANCE = cozmo.util.degrees(2)
+
+# Distance to stop short of the charger on the coarse approach
+_CHARGER_APPROACH_DISTANCE = cozmo.util.distance_mm(80)
+
+# Speed for the fine approach to the charger
+_FINE_APPROACH_SPEED = cozmo.util.speed_mmps(40)
+
+# Distance and speed for driving from the charger out to the waypoint
+_WAYPOINT_DISTANCE = cozmo.util.distance_mm(250)
+_WAYPOINT_SPEED = cozmo.util.speed_mmps(50)
+
+# The time between battery checks while waiting on an activity (in seconds)
+_BATTERY_CHECK_PERIOD = 1
+
+# Charger parking parameters
+# Distances are in millimeters, speeds in millimeters per second, times in seconds, and pitches in degrees
+_CHARGER_DISTANCE = 40
+_ALIGN_DISTANCE_TOL = 5
+_ALIGN_ANGLE_TOL = math.radians(5)
+_STRIKE_SPEED = -60
+_STRIKE_TIMEOUT = 3
+_FLATTEN_SPEED = -35
+_FLATTEN_TIMEOUT = 5
+_WALL_PITCH = 20
+
+# Terminal messages for selecting a robot and querying the selection
+# These are indexed by robot index, with zero meaning no robot
+_SELECT_MESSAGES = ('Deselected robot', 'Selected robot A', 'Selected robot B')
+_SELECTED_MESSAGES = ('No robot selected', 'Robot A is selected', 'Robot B is selected')
+
+# Robot characters accepted by the terminal and the robot indices they stand for
+_ROBOT_CHAR_TO_INDEX = {
+    'a': 1,
+    'A': 1,
+    '1': 1,
+    'b': 2,
+    'B': 2,
+    '2': 2,
+}
+
+
 class InteractMode(Enum):
     """
     A mode of interaction.
@@ -39,9 +107,12 @@ class InteractMode(Enum):
     just_b = 3
 
 
-class _RobotState(Enum):
+class _RobotState(IntEnum):
     """
     The state of a Cozmo robot in our little world.
+
+    This is an IntEnum so states hash as plain integers when the driver looks
+    up transitions.
     """
 
     # Safe and sound on its charger
@@ -78,6 +149,44 @@ class _RobotAction(Enum):
     drive_from_waypoint_to_charger = 2
 
 
+class _RobotSlot:
+    """
+    Everything we keep track of for one Cozmo robot.
+    """
+
+    __slots__ = ('letter', 'robot', 'state', 'queue', 'cancel', 'waypoint', 'service_face')
+
+    def __init__(self, letter: str):
+        """
+        Initialize a robot slot.
+
+        :param letter: The robot letter (A or B)
+        """
+
+        # The robot letter
+        self.letter = letter
+
+        # The robot instance
+        self.robot: cozmo.robot.Robot = None
+
+        # The state of the robot
+        self.state: _RobotState = None
+
+        # The queue for robot actions (only touch on the event loop)
+        # This is created on the interact thread, as it must belong to the event loop
+        self.queue: asyncio.Queue = None
+
+        # The event telling if the current activity should cancel (only touch on the event loop)
+        # This is created on the interact thread, as it must belong to the event loop
+        self.cancel: asyncio.Event = None
+
+        # The waypoint of the robot
+        self.waypoint: cozmo.util.Pose = None
+
+        # The face service for the robot
+        self.service_face = ServiceFace()
+
+
 class OperationInteract(Operation):
     """
     The interact operation.
@@ -105,9 +214,16 @@ class OperationInteract(Operation):
         self._prompted_name_response: str = None
         self._prompted_name_lock = Lock()
 
+        # An event telling if a prompted name came back (only touch on the event loop)
+        # This is created on the event loop by the interact thread
+        self._prompted_name_event: asyncio.Event = None
+
         # Unpack wanted serial numbers
-        self._wanted_serial_a = args.get('sera', '0241c714')  # Default to an actual serial number
-        self._wanted_serial_b = args.get('serb', '45a18821')  # Default to an actual serial number
+        # These are indexed by robot index minus one (so A is at 0 and B is at 1)
+        self._wanted_serials = [
+            args.get('sera', '0241c714'),  # Default to an actual serial number
+            args.get('serb', '45a18821'),  # Default to an actual serial number
+        ]
 
         # Unpack interaction mode
         self._mode = InteractMode[args.get('mode', 'both')]  # Default to both
@@ -116,14 +232,20 @@ class OperationInteract(Operation):
         # We'll run the event loop on this thread asynchronously
         self._thread_interact: Thread = None
 
-        # A kill switch for the operation (thread-safe)
-        self._should_stop = False
-        self._should_stop_lock = Lock()
+        # The event loop on the interact thread
+        self._loop: asyncio.AbstractEventLoop = None
+
+        # An executor for blocking database work
+        # The database module shares one cursor, so a single worker keeps its queries in order
+        self._executor_db = ThreadPoolExecutor(max_workers=1, thread_name_prefix='Database')
 
-        # An indicator telling if the operation stopped (thread-safe)
-        # This goes True even if the operation naturally dies
-        self._stopped = False
-        self._stopped_lock = Lock()
+        # An event that wakes the watchdog when we should stop (only touch on the event loop)
+        # This is created on the event loop by the interact thread
+        self._stop_event: asyncio.Event = None
+
+        # A lock so only one Cozmo looks around for its charger at a time (only touch on the event loop)
+        # This is created on the event loop by the interact thread
+        self._charger_scan_lock: asyncio.Lock = None
 
         # An indicator telling if the operation is in the middle of stopping (not thread-safe)
         # At this stage, the high level functionality starts to shut down
@@ -132,12 +254,9 @@ class OperationInteract(Operation):
         # An indicator telling if the low-level functionality should shut down (not thread-safe)
         self._stopping = False
 
-        # Indicators telling if the current activity should cancel for each Cozmo robot
-        self._cancel_a = False
-        self._cancel_b = False
-
-        # An indicator telling if the activity is completed
-        self._complete = False
+        # An event telling if the activity is completed (only touch on the event loop)
+        # This is created on the event loop by the interact thread
+        self._complete: asyncio.Event = None
 
         # An indicator telling if we should swap
         # This is only ever when poking around manually (but never in manual override mode)
@@ -154,32 +273,26 @@ class OperationInteract(Operation):
         # The conversation service
         self._service_convo = ServiceConvo()
 
-        # The face services for robots
-        self._service_face_a = ServiceFace()
-        self._service_face_b = ServiceFace()
-
-        # The robot instances
-        self._robot_a: cozmo.robot.Robot = None
-        self._robot_b: cozmo.robot.Robot = None
-
-        # States for the robots
-        self._robot_state_a: _RobotState = None
-        self._robot_state_b: _RobotState = None
-
-        # Queues for robot actions
-        self._robot_queue_a = queue.Queue()
-        self._robot_queue_b = queue.Queue()
-
-        # Waypoints for the robots
-        self._robot_waypoint_a: cozmo.util.Pose = None
-        self._robot_waypoint_b: cozmo.util.Pose = None
+        # Everything we keep track of for robots A and B
+        # These are indexed by robot index minus one (so A is at 0 and B is at 1)
+        self._slots: List[_RobotSlot] = [_RobotSlot('A'), _RobotSlot('B')]
 
     def start(self):
         """
         Start the interact operation.
         """
 
-        super().start()
+        # Create the event loop for the interact thread
+        # We create it here so it's available to other threads as soon as we return
+        if uvloop is not None:
+            self._loop = uvloop.new_event_loop()
+        else:
+            self._loop = asyncio.new_event_loop()
+
+        # Start new tasks eagerly if we can (only on Python 3.12 and up)
+        # Most of our tasks are short, so this often lets them finish without a trip through the scheduler
+        if hasattr(asyncio, 'eager_task_factory'):
+            self._loop.set_task_factory(asyncio.eager_task_factory)
 
         # Spawn the interact thread
         self._thread_interact = Thread(target=self._thread_interact_main, name='Interact')
@@ -190,11 +303,14 @@ class OperationInteract(Operation):
         Stop the interact operation.
         """
 
-        super().stop()
-
-        # Set the interact thread kill switch
-        with self._should_stop_lock:
-            self._should_stop = True
+        # Wake the watchdog
+        # The stop event belongs to the event loop on the interact thread, so hand the request over to it
+        # If we never started or the interact thread has already finished, there is no one to wake
+        if self._loop is not None:
+            try:
+                self._loop.call_soon_threadsafe(self._request_stop)
+            except RuntimeError:
+                pass
 
         # Wait for the interact thread to die
         if self._thread_interact is not None:
@@ -208,9 +324,8 @@ class OperationInteract(Operation):
         :return: True if such is the case, otherwise False
         """
 
-        # If we haven't stopped, we're running
-        with self._stopped_lock:
-            return not self._stopped
+        # If we aren't done, we're running
+        return not self._done.is_set()
 
     @property
     def term(self):
@@ -232,20 +347,32 @@ class OperationInteract(Operation):
         """
 
         try:
-            # Create an event loop for interaction
-            loop = asyncio.new_event_loop()
+            # Use our event loop for interaction
+            loop = self._loop
+            asyncio.set_event_loop(loop)
+
+            # Create the stop event, charger scan lock, completion and name events, robot queues, and cancel events
+            # These all belong to the event loop
+            # This happens before the loop runs, so any stop request handed over to the loop will find them
+            self._stop_event = asyncio.Event()
+            self._charger_scan_lock = asyncio.Lock()
+            self._complete = asyncio.Event()
+            self._prompted_name_event = asyncio.Event()
+            for slot in self._slots:
+                slot.queue = asyncio.Queue()
+                slot.cancel = asyncio.Event()
 
             # Print some stuff about the mode
             if self._mode == InteractMode.both:
                 self._tprint('Configured for both Cozmos A and B')
-                self._tprint(f'Want Cozmo A to have serial number {self._wanted_serial_a}')
-                self._tprint(f'Want Cozmo B to have serial number {self._wanted_serial_b}')
+                self._tprint(f'Want Cozmo A to have serial number {self._wanted_serials[0]}')
+                self._tprint(f'Want Cozmo B to have serial number {self._wanted_serials[1]}')
             elif self._mode == InteractMode.just_a:
                 self._tprint('Configured for just Cozmo A')
-                self._tprint(f'Want Cozmo A to have serial number {self._wanted_serial_a}')
+                self._tprint(f'Want Cozmo A to have serial number {self._wanted_serials[0]}')
             elif self._mode == InteractMode.just_b:
                 self._tprint('Configured for just Cozmo B')
-                self._tprint(f'Want Cozmo B to have serial number {self._wanted_serial_b}')
+                self._tprint(f'Want Cozmo B to have serial number {self._wanted_serials[1]}')
 
             self._tprint('Establishing as many connections as possible')
 
@@ -266,184 +393,150 @@ class OperationInteract(Operation):
                     self._tprint('No more Cozmos available (this is normal)')
                     break
 
-                # The connection index is just the length of the connections list
-                i = len(connections)
-
-                self._tprint(f'Established connection #{i}')
-
                 # Keep the connection
-                connections.insert(i, conn)
-
-            # Go over all the connections we've made
-            for i in range(0, len(connections)):
-                conn = connections[i]
-
-                # Whether or not to keep the connection
-                # We only keep the ones we need, but we don't know which those are until we've connected to everyone
-                keep = False
-
-                # Wait for the robot on this connection
-                robot = loop.run_until_complete(conn.wait_for_robot())
-
-                self._tprint(f'Robot on connection #{i} has serial number {robot.serial}')
-
-                # If we're assigning both Cozmos
-                if self._mode == InteractMode.both:
-                    # If this serial matches that desired for robot A
-                    if robot.serial == self._wanted_serial_a:
-                        # Keep the connection
-                        keep = True
-
-                        # Assign robot A
-                        self._robot_a = robot
-
-                        self._tprint(
-                            f'On connection #{i}, robot A was assigned serial number {robot.serial} (need A and B)')
-
-                    # If this serial matches that desired for robot B
-                    if robot.serial == self._wanted_serial_b:
-                        # Keep the connection
-                        keep = True
-
-                        # Assign robot B
-                        self._robot_b = robot
-
-                        self._tprint(
-                            f'On connection #{i}, robot B was assigned serial number {robot.serial} (need A and B)')
+                connections.append(conn)
 
-                # If we're assigning just Cozmo A
-                if self._mode == InteractMode.just_a:
-                    # If this serial matches that desired for robot A
-                    if robot.serial == self._wanted_serial_a:
-                        # Keep the connection
-                        keep = True
+                self._tprint(f'Established connection #{len(connections) - 1}')
 
-                        # Assign robot A
-                        self._robot_a = robot
-
-                        self._tprint(
-                            f'On connection #{i}, robot A was assigned serial number {robot.serial} (need just A)')
-
-                # If we're assigning just Cozmo B
-                if self._mode == InteractMode.just_b:
-                    # If this serial matches that desired for robot B
-                    if robot.serial == self._wanted_serial_b:
-                        # Keep the connection
-                        keep = True
-
-                        # Assign robot B
-                        self._robot_b = robot
-
-                        self._tprint(
-                            f'On connection #{i}, robot B was assigned serial number {robot.serial} (need just B)')
+            # Run the rest of the operation on the event loop
+            # The Cozmo SDK runs the event loop itself while connecting, so asyncio.run() can't drive all this
+            loop.run_until_complete(self._amain(connections))
+        finally:
+            # Finalize any async generators and close the event loop
+            # This is the same teardown asyncio.run() would do for us
+            self._loop.run_until_complete(self._loop.shutdown_asyncgens())
+            self._loop.close()
 
-                # If we're not keeping this connection
-                if not keep:
-                    self._tprint(f'Connection #{i} is not needed, so disconnecting it')
+            # Let any outstanding database work finish
+            self._executor_db.shutdown()
 
-                    # Abort the connection
-                    conn.abort(0)
+            # Signal that we're done
+            # This wakes anyone waiting on the operation
+            self._done.set()
 
-            # Stop if we're missing a Cozmo
-            if self._mode == InteractMode.both:
-                # Whether or not one is missing
-                missing = False
-
-                # Look at A
-                if self._robot_a is None:
-                    missing = True
-                    self._tprint('Configured for both, but Cozmo A is missing')
-
-                # Look at B
-                if self._robot_b is None:
-                    missing = True
-                    self._tprint('Configured for both, but Cozmo B is missing')
-
-                # If one is missing
-                if missing:
-                    self._tprint('At least one Cozmo is missing, so refusing to continue')
-                    return
-            elif self._mode == InteractMode.just_a:
-                # Look at A
-                if self._robot_a is None:
-                    self._tprint('Cozmo A is missing, so refusing to continue')
-                    return
-            elif self._mode == InteractMode.just_b:
-                # Look at B
-                if self._robot_b is None:
-                    self._tprint('Cozmo B is missing, so refusing to continue')
+    async def _amain(self, connections: List[cozmo.conn.CozmoConnection]):
+        """
+        The main coroutine of the interact thread.
 
-            self._tprint('Beginning interactive procedure')
+        :param connections: The connections made to all available Cozmos
+        """
 
-            self._tprint('+-----------------------------------------------------------------+')
-            self._tprint('| IMPORTANT: We are assuming both Cozmos start on their chargers! |')
-            self._tprint('+-----------------------------------------------------------------+')
+        # The robots we need for the configured mode
+        # Each is a tuple of the form (index, letter, serial number)
+        wanted = []
+        if self._mode in (InteractMode.both, InteractMode.just_a):
+            wanted.append((1, 'A', self._wanted_serials[0]))
+        if self._mode in (InteractMode.both, InteractMode.just_b):
+            wanted.append((2, 'B', self._wanted_serials[1]))
 
-            # Assume both Cozmos start on their chargers (as advertised ^^^)
-            self._robot_state_a = _RobotState.home
-            self._robot_state_b = _RobotState.home
+        # Wait for the robots on all connections at once
+        # The handshakes are independent, so there's no need to do them one after another
+        # A failed handshake comes back as its exception, so it doesn't take the others down with it
+        robots = await asyncio.gather(*(conn.wait_for_robot() for conn in connections), return_exceptions=True)
 
-            tasks = asyncio.gather(
-                # The watchdog coroutine handles the shutdown protocol
-                self._watchdog(),
+        # Go over all the connections we've made
+        for i, (conn, robot) in enumerate(zip(connections, robots)):
+            # Skip connections that failed to produce a robot
+            if isinstance(robot, BaseException):
+                self._tprint(f'Connection #{i} failed to produce a robot ({robot!r}), so disconnecting it')
 
-                # Driver coroutines for Cozmos A and B
-                # These routines take care of running individual bite-size tasks
-                self._driver(1, self._robot_a),
-                self._driver(2, self._robot_b),
+                # Abort the connection
+                conn.abort(0)
 
-                # The choreographer coroutine automates the robots from a high level
-                self._choreographer(),
+                continue
 
-                # Explicitly provide our event loop
-                # Without this, there will be an error along the lines of "no current event loop"
-                loop=loop,
-            )
+            # Whether or not to keep the connection
+            # We only keep the ones we need, but we don't know which those are until we've connected to everyone
+            keep = False
 
-            self._tprint('Setting up face services')
+            self._tprint(f'Robot on connection #{i} has serial number {robot.serial}')
 
-            # Create face services
-            self._service_face_a = ServiceFace()
-            self._service_face_b = ServiceFace()
+            # Assign the robot wherever its serial number is wanted
+            for index, letter, serial in wanted:
+                if robot.serial == serial:
+                    # Keep the connection
+                    keep = True
 
-            self._tprint('Loading known faces from database')
+                    # Assign the robot
+                    self._slots[index - 1].robot = robot
 
-            # Query known faces from database
-            known_faces = database.loadStudents()
+                    self._tprint(f'On connection #{i}, robot {letter} was assigned serial number {robot.serial}')
 
-            # If there are known faces
-            if known_faces is not None:
-                # Loop through them
-                # We received their IDs and string-encoded identities from the database
-                for (fid, ident_enc) in known_faces:
-                    # Decode string-encoded identity
-                    # The result is a 128-tuple of 64-bit floats
-                    ident = self._face_ident_decode(ident_enc)
+            # If we're not keeping this connection
+            if not keep:
+                self._tprint(f'Connection #{i} is not needed, so disconnecting it')
 
-                    # Register identity with both face services
-                    # That way both Cozmos will be able to recognize the face
-                    self._service_face_a.add_identity(fid, ident)
-                    self._service_face_b.add_identity(fid, ident)
+                # Abort the connection
+                conn.abort(0)
 
-            # Stop the face services
-            self._service_face_a.start()
-            self._service_face_b.start()
+        # Whether or not a Cozmo is missing
+        missing = False
 
-            # Run the event loop until it stops (it's not actually forever)
-            loop.run_forever()
+        # Look at each Cozmo we need
+        for index, letter, serial in wanted:
+            if self._slots[index - 1].robot is None:
+                missing = True
+                self._tprint(f'Cozmo {letter} is missing')
 
-            # Keep running the event loop while things are pending
-            loop.run_until_complete(tasks)
+        # Stop if we're missing a Cozmo
+        if missing:
+            self._tprint('At least one Cozmo is missing, so refusing to continue')
+            return
 
-            # Stop the face services
-            self._service_face_a.stop()
-            self._service_face_b.stop()
+        self._tprint('Beginning interactive procedure')
+
+        self._tprint('+-----------------------------------------------------------------+')
+        self._tprint('| IMPORTANT: We are assuming both Cozmos start on their chargers! |')
+        self._tprint('+-----------------------------------------------------------------+')
+
+        # Assume both Cozmos start on their chargers (as advertised ^^^)
+        for slot in self._slots:
+            slot.state = _RobotState.home
+
+        self._tprint('Loading known faces from database')
+
+        # Query known faces from database
+        known_faces = database.loadStudents()
+
+        # If there are known faces
+        if known_faces is not None:
+            # Decode them all up front
+            # We received their IDs and string-encoded identities from the database
+            # Each decoded identity is a 128-dimensional vector of 32-bit floats
+            fids = [fid for (fid, ident_enc) in known_faces]
+            idents = self._face_idents_decode([ident_enc for (fid, ident_enc) in known_faces])
+            identities = list(zip(fids, idents))
+
+            # Older faces were stored as JSON, which is slow to load
+            # Rewrite them in the packed format so this only happens once
+            legacy_faces = [(fid, self._face_ident_encode(ident))
+                            for (fid, ident_enc), ident in zip(known_faces, idents)
+                            if self._face_ident_is_json(ident_enc)]
+            if legacy_faces:
+                self._tprint(f'Converting {len(legacy_faces)} known faces to the packed format')
+                database.updateStudentImages(legacy_faces)
+
+            # Register identities with both face services in one go
+            # That way both Cozmos will be able to recognize the faces
+            # The drivers start and stop the face services themselves
+            for slot in self._slots:
+                slot.service_face.add_identities(identities)
+
+        # Run everything until it all finishes
+        await asyncio.gather(
+            # The watchdog coroutine handles the shutdown protocol
+            self._watchdog(),
+
+            # Driver coroutines for Cozmos A and B
+            # These routines take care of running individual bite-size tasks
+            self._driver(1, self._slots[0].robot),
+            self._driver(2, self._slots[1].robot),
+
+            # The choreographer coroutine automates the robots from a high level
+            self._choreographer(),
+        )
 
-            self._tprint('Goodbye!')
-        finally:
-            # Set the stopped flag
-            with self._stopped_lock:
-                self._stopped = True
+        self._tprint('Goodbye!')
 
     async def _watchdog(self):
         """
@@ -452,28 +545,12 @@ class OperationInteract(Operation):
 
         self._tprint('Watchdog has started')
 
-        while not self._almost_stopping:
-            # Check if we should stop
-            # There shouldn't be much contention on this lock
-            with self._should_stop_lock:
-                should_stop = self._should_stop
-
-            # If we should stop, start stopping
-            if should_stop:
-                # Set the stopping indicator
-                # All high-level loops should start shutting down
-                self._almost_stopping = True
-
-                # Get the event loop
-                loop = asyncio.get_event_loop()
+        # Sleep until we should stop
+        await self._stop_event.wait()
 
-                # Politely ask the loop to stop soon
-                loop.call_soon(loop.stop)
-
-                self._tprint('The event loop will stop soon')
-            else:
-                # Yield control
-                await asyncio.sleep(0)
+        # Set the stopping indicator
+        # All high-level loops should start shutting down
+        self._almost_stopping = True
 
         self._tprint('Watchdog has stopped')
 
@@ -485,8 +562,11 @@ class OperationInteract(Operation):
         :param robot: The robot instance
         """
 
+        # Get the slot for this robot
+        slot = self._slots[index - 1]
+
         # Convert robot index to robot letter
-        letter = 'A' if index == 1 else 'B'
+        letter = slot.letter
 
         self._tprint(f'Driver for robot {letter} has started')
 
@@ -499,164 +579,89 @@ class OperationInteract(Operation):
         robot.camera.color_image_enabled = True
         robot.camera.image_stream_enabled = True
 
+        # Get the robot-specific data
+        state_queue = slot.queue
+        service_face = slot.service_face
+
         # Listen for camera frames from this Cozmo
-        # We create a partially-bound function that sneaks in our index and robot parameters
+        # The handler feeds them straight into this Cozmo's face service
         robot.camera.add_event_handler(cozmo.robot.camera.EvtNewRawCameraImage,
-                                       functools.partial(self._driver_on_evt_new_raw_camera_image, index, robot))
-
-        # Get the robot-specific data
-        state_queue = None
-        service_face = None
-        if index == 1:
-            state_queue = self._robot_queue_a
-            service_face = self._service_face_a
-        elif index == 2:
-            state_queue = self._robot_queue_b
-            service_face = self._service_face_b
+                                       self._make_camera_handler(service_face))
 
         # Start the face service
         service_face.start()
 
         while not self._stopping:  # Low-level loop (this needs to outlive the choreographer)
-            # Yield control
-            await asyncio.sleep(0)
+            # Sleep until the next command comes in
+            # Each command is a tuple of the next state followed by any arguments for its action
+            # The choreographer enqueues None on its way out to wake us up
+            command = await state_queue.get()
 
-            # Try to get the next state
-            state_next: _RobotState = None
-            try:
-                state_next = state_queue.get_nowait()
-            except queue.Empty:
-                pass
+            # If a command was dequeued
+            if command is not None:
+                # Split the command into the next state and its arguments
+                state_next: _RobotState = command[0]
+                args = command[1:]
 
-            # If a state was dequeued
-            if state_next is not None:
                 # Get the current state
-                state_current = None
-                if index == 1:
-                    state_current = self._robot_state_a
-                elif index == 2:
-                    state_current = self._robot_state_b
+                state_current = slot.state
 
                 # The state we actually ended up going to
                 # By default, this is the current state
                 # On a successful transition, we'll update this
                 state_final = state_current
 
-                # The task to wait on
-                task = None
-
-                if state_current == _RobotState.home:
-                    if state_next == _RobotState.waypoint:
-                        # GOTO home -> waypoint
-                        state_final = state_next
-
-                        # Drive from the charger to the waypoint
-                        task = asyncio.ensure_future(self._do_drive_from_charger_to_waypoint(index, robot))
-                elif state_current == _RobotState.waypoint:
-                    if state_next == _RobotState.home:
-                        # GOTO waypoint -> home
-                        state_final = state_next
-
-                        # Drive from the waypoint to the charger
-                        task = asyncio.ensure_future(self._do_drive_from_waypoint_to_charger(index, robot))
-                    elif state_next == _RobotState.convo:
-                        # GOTO waypoint -> convo
-                        state_final = state_next
-
-                        # Carry out the conversation
-                        task = asyncio.ensure_future(self._do_convo(index, robot))
-                    elif state_next == _RobotState.greet:
-                        # GOTO waypoint -> greet
-                        state_final = state_next
-
-                        # Carry out greeting
-                        task = asyncio.ensure_future(self._do_meet_and_greet(index, robot))
-                    elif state_next == _RobotState.freeplay:
-                        # GOTO waypoint -> freeplay
-                        state_final = state_next
-
-                        # Carry out freeplay
-                        task = asyncio.ensure_future(self._do_freeplay(index, robot))
-                    elif state_next == _RobotState.pong:
-                        # GOTO waypoint -> pong
-                        state_final = state_next
-
-                        # Carry out pong
-                        task = asyncio.ensure_future(self._do_pong(index, robot))
-                elif state_current == _RobotState.convo:
-                    if state_next == _RobotState.waypoint:
-                        # GOTO convo -> waypoint
-                        state_final = state_next
-
-                        # Return to the waypoint
-                        task = asyncio.ensure_future(self._do_return_to_waypoint(index, robot))
-                elif state_current == _RobotState.greet:
-                    if state_next == _RobotState.waypoint:
-                        # GOTO greet -> waypoint
-                        state_final = state_next
-
-                        # Return to the waypoint
-                        task = asyncio.ensure_future(self._do_return_to_waypoint(index, robot))
-                elif state_current == _RobotState.freeplay:
-                    if state_next == _RobotState.waypoint:
-                        # GOTO freeplay -> waypoint
-                        state_final = state_next
-
-                        # Return to the waypoint
-                        task = asyncio.ensure_future(self._do_return_to_waypoint(index, robot))
-                elif state_current == _RobotState.pong:
-                    if state_next == _RobotState.waypoint:
-                        # GOTO pong -> waypoint
-                        state_final = state_next
-
-                        # Return to the waypoint
-                        task = asyncio.ensure_future(self._do_return_to_waypoint(index, robot))
+                # The action coroutine to wait on
+                coro = None
+
+                # Look up the action for this transition
+                action = self._TRANSITIONS.get((state_current, state_next))
+
+                if action is not None:
+                    # GOTO current -> next
+                    state_final = state_next
+
+                    # Prepare the action (it doesn't run until we await it)
+                    coro = action(self, index, robot, *args)
 
                 # If the state did not change
-                if state_final == state_current:
+                if state_final is state_current:
                     self._tprint(f'Failed to transition from state "{state_current.name}" to state "{state_next.name}"')
 
                 # Update the current state
-                if index == 1:
-                    self._robot_state_a = state_final
-                elif index == 2:
-                    self._robot_state_b = state_final
+                slot.state = state_final
 
-                if task is not None:
-                    # Wait for the task
+                if coro is not None:
+                    # Carry out the action right here
                     # This prevents any issues with multiple simultaneous movements
-                    await task
+                    await coro
 
         # Stop the face service
         service_face.stop()
 
         self._tprint(f'Driver for robot {letter} has stopped')
 
-    def _driver_on_evt_new_raw_camera_image(self, index: int, robot: cozmo.robot.Robot,
-                                            evt: cozmo.robot.camera.EvtNewRawCameraImage, **kwargs):
+    @staticmethod
+    def _make_camera_handler(service_face: ServiceFace) -> Callable:
         """
-        Called by the Cozmo SDK when a camera frame comes in.
+        Make a handler for camera frames coming in from one Cozmo.
 
-        :param index: The robot index
-        :param robot: The robot instance
-        :param evt: The handled event
-        :param kwargs: Excess keyword arguments
+        :param service_face: The face service for that Cozmo
+        :return: The handler
         """
 
-        # The camera frame image
-        image = evt.image
+        def on_evt_new_raw_camera_image(evt: cozmo.robot.camera.EvtNewRawCameraImage, **kwargs):
+            """
+            Called by the Cozmo SDK when a camera frame comes in.
 
-        # The face service for this Cozmo robot
-        face: ServiceFace = None
+            :param evt: The handled event
+            :param kwargs: Excess keyword arguments
+            """
 
-        # Pick the corresponding face service
-        if index == 1:
-            face = self._service_face_a
-        elif index == 2:
-            face = self._service_face_b
+            # Update the Cozmo-corresponding face service with the new camera frame
+            service_face.update(evt.image)
 
-        # Update the Cozmo-corresponding face service with the new camera frame
-        face.update(image)
+        return on_evt_new_raw_camera_image
 
     async def _do_drive_from_charger_to_waypoint(self, index: int, robot: cozmo.robot.Robot):
         """
@@ -666,8 +671,11 @@ class OperationInteract(Operation):
         :param robot: The robot instance
         """
 
+        # Get the slot for this robot
+        slot = self._slots[index - 1]
+
         # Convert robot index to robot letter
-        letter = 'A' if index == 1 else 'B'
+        letter = slot.letter
 
         self._tprint(f'Robot {letter} is departing from charger and heading to waypoint')
 
@@ -676,15 +684,12 @@ class OperationInteract(Operation):
 
         # Drive forward to the waypoint
         await robot.drive_straight(
-            distance=cozmo.util.distance_mm(250),
-            speed=cozmo.util.speed_mmps(50),
+            distance=_WAYPOINT_DISTANCE,
+            speed=_WAYPOINT_SPEED,
         ).wait_for_completed()
 
         # Save robot waypoint
-        if index == 1:
-            self._robot_waypoint_a = robot.pose
-        elif index == 2:
-            self._robot_waypoint_b = robot.pose
+        slot.waypoint = robot.pose
 
     async def _do_drive_from_waypoint_to_charger(self, index: int, robot: cozmo.robot.Robot):
         """
@@ -694,13 +699,16 @@ class OperationInteract(Operation):
         :param robot: The robot instance
         """
 
+        # Get the slot for this robot
+        slot = self._slots[index - 1]
+
         # Convert robot index to robot letter
-        letter = 'A' if index == 1 else 'B'
+        letter = slot.letter
 
         self._tprint(f'Robot {letter} is departing from waypoint and heading to charger')
 
         # Turn toward the charger
-        await robot.turn_in_place(cozmo.util.degrees(180)).wait_for_completed()
+        await robot.turn_in_place(_TURN_AROUND).wait_for_completed()
 
         #
         # BEGIN INTEGRATED CHARGER RETURN CODE
@@ -709,59 +717,50 @@ class OperationInteract(Operation):
 
         # Look a little bit down but not straight ahead
         # We need the camera to be able to see the charger
-        await robot.set_head_angle(cozmo.util.degrees(0)).wait_for_completed()
+        await robot.set_head_angle(_HEAD_LEVEL).wait_for_completed()
 
         # Cozmo's accelerometer is located in his head
         # We need to take a baseline reading before we use accelerometer during charger parking
-        pitch_threshold = math.fabs(robot.pose_pitch.degrees) + 1
+        pitch_threshold = abs(robot.pose_pitch.degrees) + 1
 
         # Drive to the charger
         await self._charger_return_go_to_charger_coarse(robot)
 
-        # If the charger location is known (it should be)
-        if robot.world.charger is not None:
-            # Invalidate the charger pose
-            if robot.world.charger.pose.is_comparable(robot.pose):
-                robot.world.charger.pose.invalidate()
+        # If the charger location is known (it should be), invalidate the charger pose
+        charger = self._charger_return_known_charger(robot)
+        if charger is not None:
+            charger.pose.invalidate()
 
         # Look for the charger again
-        await self._charger_return_find_charger(robot)
+        charger = await self._charger_return_find_charger(robot)
 
         # Add finishing touches to our staging
-        await self._charger_return_go_to_charger_fine(robot)
+        await self._charger_return_go_to_charger_fine(robot, charger)
 
         # Face away from the charger (very precisely)
-        await robot.turn_in_place(cozmo.util.degrees(180),
-                                  angle_tolerance=cozmo.util.degrees(2)).wait_for_completed()
+        await robot.turn_in_place(_TURN_AROUND, angle_tolerance=_PARK_TURN_TOLERANCE).wait_for_completed()
 
         # Point head forward-ish and lift lift out of way of charger
-        await robot.set_lift_height(height=0.5, max_speed=10, in_parallel=True).wait_for_completed()
-        await robot.set_head_angle(cozmo.util.degrees(0), in_parallel=True).wait_for_completed()
+        # These use different motors, so let them move at the same time
+        lift = robot.set_lift_height(height=0.5, max_speed=10, in_parallel=True)
+        head = robot.set_head_angle(_HEAD_LEVEL, in_parallel=True)
+        await asyncio.gather(lift.wait_for_completed(), head.wait_for_completed())
 
-        self._tprint('Begin strike phase')
-        self._tprint('The robot will try to strike the base of the charger')
+        _log.debug('Begin strike phase')
+        _log.debug('The robot will try to strike the base of the charger')
 
         # Start driving backward pretty quickly
-        robot.drive_wheel_motors(-60, -60)
-
-        # Timeout and elapsed time for strike phase
-        timeout = 3
-        elapsed = 0
-        delta = 0.05
+        robot.drive_wheel_motors(_STRIKE_SPEED, _STRIKE_SPEED)
 
         # Wait until we hit the charger
-        # Cozmo will start to pitch forward, and that breaks the loop
-        while True:
-            # Wait one phase delta
-            await asyncio.sleep(delta)
-            elapsed += delta
+        # Cozmo will start to pitch forward, and that ends the wait
+        pitch = await self._charger_return_await_pitch(robot, lambda p: p >= pitch_threshold,
+                                                      timeout=_STRIKE_TIMEOUT)
 
-            if elapsed >= timeout:
-                self._tprint('Timed out while waiting for robot to strike the charger')
-                break
-            elif math.fabs(robot.pose_pitch.degrees) >= pitch_threshold:
-                self._tprint('The robot seems to have struck the charger (this is normal)')
-                break
+        if pitch is None:
+            self._tprint('Timed out while waiting for robot to strike the charger')
+        else:
+            _log.debug('The robot seems to have struck the charger (this is normal)')
 
         # Striking done, stop motors
         robot.stop_all_motors()
@@ -769,34 +768,24 @@ class OperationInteract(Operation):
         # Wait a little
         await asyncio.sleep(0.5)
 
-        self._tprint('Begin flattening phase')
-        self._tprint('The robot will try to flatten out on the charger')
+        _log.debug('Begin flattening phase')
+        _log.debug('The robot will try to flatten out on the charger')
 
         # Start driving backward a little slower
         # We want to avoid driving up onto the back wall of the charger
-        robot.drive_wheel_motors(-35, -35)
-
-        # Timeout and elapsed time for flattening phase
-        timeout = 5
-        elapsed = 0
-        delta = 0.05
+        robot.drive_wheel_motors(_FLATTEN_SPEED, _FLATTEN_SPEED)
 
         # Wait until we flatten back out
         # The pitch returns to flat which indicates fully onboard
-        while True:
-            # Wait one phase time
-            await asyncio.sleep(delta)
-            elapsed += delta
+        pitch = await self._charger_return_await_pitch(robot, lambda p: p > _WALL_PITCH or p < pitch_threshold,
+                                                      timeout=_FLATTEN_TIMEOUT)
 
-            if elapsed >= timeout:
-                self._tprint('Timed out while waiting for robot to flatten out on the charger')
-                break
-            elif math.fabs(robot.pose_pitch.degrees) > 20:
-                self._tprint('Robot pitch has reached an unexpected value (drove on wall?)')
-                break
-            elif math.fabs(robot.pose_pitch.degrees) < pitch_threshold:
-                self._tprint('The robot seems to have flattened out on the charger (this is normal)')
-                break
+        if pitch is None:
+            self._tprint('Timed out while waiting for robot to flatten out on the charger')
+        elif pitch > _WALL_PITCH:
+            self._tprint('Robot pitch has reached an unexpected value (drove on wall?)')
+        else:
+            _log.debug('The robot seems to have flattened out on the charger (this is normal)')
 
         # Flattening done, stop motors
         robot.stop_all_motors()
@@ -824,7 +813,7 @@ class OperationInteract(Operation):
             self._tprint('The charger was not detected! Assuming we\'re on it?')  # TODO: What do? Call for help...
 
         # Set completed flag
-        self._complete = True
+        self._complete.set()
 
         #
         # END INTEGRATED CHARGER RETURN CODE
@@ -840,38 +829,48 @@ class OperationInteract(Operation):
         :param robot: The robot instance
         """
 
+        # If we already know where the charger is, there's no need to look around for it
+        charger = self._charger_return_known_charger(robot)
+        if charger is not None:
+            self._tprint('The charger pose is already known')
+            return charger
+
         self._tprint('Starting to look for the charger')
 
         rnd = 1
 
         # Be persistent, Cozmo!
         while True:
-            self._tprint(f'Look for charger (round {rnd})')
+            _log.debug('Look for charger (round %d)', rnd)
 
             rnd += 1
 
-            # Remember the robot pose before looking around
-            pose_before = robot.pose
+            # Only one Cozmo looks around at a time
+            # Both spin in place, so two at once could bump into each other (and see each other's chargers)
+            # Everything else about parking can still overlap between the two Cozmos
+            async with self._charger_scan_lock:
+                # Remember the robot pose before looking around
+                pose_before = robot.pose
 
-            # Start to look around at the surroundings
-            # The Cozmo app will pick up on any visible charger
-            behave = robot.start_behavior(cozmo.behavior.BehaviorTypes.LookAroundInPlace)
+                # Start to look around at the surroundings
+                # The Cozmo app will pick up on any visible charger
+                behave = robot.start_behavior(cozmo.behavior.BehaviorTypes.LookAroundInPlace)
 
-            # Yield control
-            await asyncio.sleep(0)
+                # Yield control
+                await asyncio.sleep(0)
 
-            # While we're looking around, keep an eye out for chargers
-            try:
-                seen_charger = await robot.world.wait_for_observed_charger(timeout=3, include_existing=True)
-            except cozmo.exceptions.CozmoSDKException:
-                seen_charger = None
+                # While we're looking around, keep an eye out for chargers
+                try:
+                    seen_charger = await robot.world.wait_for_observed_charger(timeout=3, include_existing=True)
+                except cozmo.exceptions.CozmoSDKException:
+                    seen_charger = None
 
-            # Stop looking around
-            # We may or may not have seen a charger
-            behave.stop()
+                # Stop looking around
+                # We may or may not have seen a charger
+                behave.stop()
 
-            # Go back to the pose before looking around
-            await robot.go_to_pose(pose_before).wait_for_completed()
+                # Go back to the pose before looking around
+                await robot.go_to_pose(pose_before).wait_for_completed()
 
             # If we saw a charger, use that one
             if seen_charger is not None:
@@ -887,59 +886,57 @@ class OperationInteract(Operation):
                 # TODO: Is is okay that this happens here? I know we talked about asking for help...
                 await robot.say_text('A little help?').wait_for_completed()
 
-    async def _charger_return_go_to_charger_coarse(self, robot: cozmo.robot.Robot):
+    @staticmethod
+    def _charger_return_known_charger(robot: cozmo.robot.Robot) -> Optional[cozmo.objects.Charger]:
         """
-        Coarsely drive a robot up to the first seen charger.
-
-        This ballparks it. There must be further correction.
+        Get the charger a robot already knows the location of.
 
         :param robot: The robot instance
+        :return: The charger or None if its location is not known
         """
 
-        # The charger reference
-        charger = None
+        # Grab the charger reference
+        charger = robot.world.charger
 
         # If the charger location is known
-        if robot.world.charger is not None:
-            # If the charger pose is in the same coordinate frame as the robot
-            # This might not be the case if the robot gets picked up by a person or falls ("delocalizing")
-            if robot.world.charger.pose.is_comparable(robot.pose):
-                self._tprint('The charger pose is already known')
+        # Its pose also needs to be in the same coordinate frame as the robot
+        # This might not be the case if the robot gets picked up by a person or falls ("delocalizing")
+        if charger is not None and charger.pose.is_comparable(robot.pose):
+            return charger
+
+        return None
+
+    async def _charger_return_go_to_charger_coarse(self, robot: cozmo.robot.Robot):
+        """
+        Coarsely drive a robot up to the first seen charger.
+
+        This ballparks it. There must be further correction.
 
-                # Just take the charger reference
-                charger = robot.world.charger
+        :param robot: The robot instance
+        """
 
-        # If we don't yet have the charger reference
-        if not charger:
-            # Find the charger
-            charger = await self._charger_return_find_charger(robot)
+        # Find the charger
+        # If we already know where it is, this returns right away
+        charger = await self._charger_return_find_charger(robot)
 
         # Drive to the charger the first time
         # This is a ballpark maneuver; we'll fine-tune it next
         await robot.go_to_object(
             charger,
-            distance_from_object=cozmo.util.distance_mm(80),
+            distance_from_object=_CHARGER_APPROACH_DISTANCE,
             num_retries=5
         ).wait_for_completed()
 
-    async def _charger_return_go_to_charger_fine(self, robot: cozmo.robot.Robot):
+    async def _charger_return_go_to_charger_fine(self, robot: cozmo.robot.Robot, charger: cozmo.objects.Charger):
         """
         The fine part of charger goto functionality.
 
         Make sure you have called the coarse variant first.
 
         :param robot: The robot instance
+        :param charger: The charger, freshly located
         """
 
-        # Grab the charger reference
-        charger = robot.world.charger
-
-        # Assumed distance from charger
-        charger_distance = 40
-
-        # Speed at which to drive
-        speed = 40
-
         # Positions of robot and charger
         robot_pos = robot.pose.position.x_y_z
         charger_pos = charger.pose.position.x_y_z
@@ -948,118 +945,206 @@ class OperationInteract(Operation):
         robot_rot_xy = robot.pose_angle.radians
         charger_rot_xy = charger.pose.rotation.angle_z.radians
 
-        # Compute virtual target position
-        # This coordinate space is in Cozmo's head
-        virtual_pos = (
-            charger_pos[0] - charger_distance * math.cos(charger_rot_xy),
-            charger_pos[1] - charger_distance * math.sin(charger_rot_xy),
-            charger_pos[2],
-        )
+        # Unit vector the charger faces along in the XY plane
+        charger_dir = (math.cos(charger_rot_xy), math.sin(charger_rot_xy))
 
         # Direction and distance to target position (in front of charger)
-        distance = math.sqrt(
-            (virtual_pos[0] - robot_pos[0]) ** 2 +
-            (virtual_pos[1] - robot_pos[1]) ** 2 +
-            (virtual_pos[2] - robot_pos[2]) ** 2
-        )
-
-        # Angle of vector going from robot's origin to target's position
-        vec = (virtual_pos[0] - robot_pos[0], virtual_pos[1] - robot_pos[1], virtual_pos[2] - robot_pos[2])
-        theta_t = math.atan2(vec[1], vec[0])
+        distance, theta_t = self._charger_return_alignment(robot_pos, charger_pos, charger_dir, _CHARGER_DISTANCE)
 
         # Face the target position
         angle = self._charger_return_wrap_radians(theta_t - robot_rot_xy)
         await robot.turn_in_place(cozmo.util.radians(angle)).wait_for_completed()
 
         # Drive toward the target position
-        await robot.drive_straight(cozmo.util.distance_mm(distance),
-                                   cozmo.util.speed_mmps(speed)).wait_for_completed()
+        await robot.drive_straight(cozmo.util.distance_mm(distance), _FINE_APPROACH_SPEED).wait_for_completed()
 
         # Face the charger
         angle = self._charger_return_wrap_radians(charger_rot_xy - theta_t)
         await robot.turn_in_place(cozmo.util.radians(angle)).wait_for_completed()
 
-        try:
-            charger = await robot.world.wait_for_observed_charger(timeout=2, include_existing=True)
-        except cozmo.exceptions.CozmoSDKException:
-            self._tprint('Charger not seen, so can\'t verify positioning')
+        # If the charger is in view right now and in our coordinate frame, its pose is fresh enough to verify against
+        # Otherwise, give it a little while to be seen again
+        if not (charger.is_visible and charger.pose.is_comparable(robot.pose)):
+            try:
+                charger = await robot.world.wait_for_observed_charger(timeout=2, include_existing=True)
+            except cozmo.exceptions.CozmoSDKException:
+                self._tprint('Charger not seen, so can\'t verify positioning')
 
         # Positions of robot and charger
         robot_pos = robot.pose.position.x_y_z
         charger_pos = charger.pose.position.x_y_z
 
-        # Rotations of robot and charger in XY plane (i.e. on up-and-down Z-axis)
+        # Rotation of robot in XY plane (i.e. on up-and-down Z-axis)
         robot_rot_xy = robot.pose_angle.radians
-        charger_rot_xy = charger.pose.rotation.angle_z.radians
-
-        # Compute virtual target position
-        # This coordinate space is in Cozmo's head
-        virtual_pos = (
-            charger_pos[0] - charger_distance * math.cos(charger_rot_xy),
-            charger_pos[1] - charger_distance * math.sin(charger_rot_xy),
-            charger_pos[2],
-        )
 
-        # Direction and distance to target position (in front of charger)
-        distance = math.sqrt(
-            (virtual_pos[0] - robot_pos[0]) ** 2 +
-            (virtual_pos[1] - robot_pos[1]) ** 2 +
-            (virtual_pos[2] - robot_pos[2]) ** 2
-        )
+        # If the charger was seen at a new angle, update its rotation and direction
+        # Otherwise, we can keep using the ones from before
+        if charger.pose.rotation.angle_z.radians != charger_rot_xy:
+            charger_rot_xy = charger.pose.rotation.angle_z.radians
+            charger_dir = (math.cos(charger_rot_xy), math.sin(charger_rot_xy))
 
-        distance_tol = 5
-        angle_tol = 5 * math.pi / 180
+        # Distance to target position (in front of charger)
+        # We only need the distance here, not the direction
+        distance, _ = self._charger_return_alignment(robot_pos, charger_pos, charger_dir, _CHARGER_DISTANCE)
 
-        if distance < distance_tol and math.fabs(robot_rot_xy - charger_rot_xy) < angle_tol:
+        if distance < _ALIGN_DISTANCE_TOL and math.fabs(robot_rot_xy - charger_rot_xy) < _ALIGN_ANGLE_TOL:
             self._tprint('Successfully aligned')
         else:
             self._tprint('Did not align successfully')  # TODO: Should we retry here?
 
+    @staticmethod
+    async def _charger_return_await_pitch(robot: cozmo.robot.Robot, predicate: Callable[[float], bool],
+                                          timeout: float) -> Optional[float]:
+        """
+        Wait for the pitch of a robot to satisfy a predicate.
+
+        Cozmo's accelerometer is located in his head, so this is how we feel
+        our way onto the charger.
+
+        :param robot: The robot instance
+        :param predicate: The test on the absolute pitch (in degrees)
+        :param timeout: The maximum time to wait (in seconds)
+        :return: The absolute pitch that satisfied the predicate or None on timeout
+        """
+
+        # The pitch that satisfied the predicate
+        # A list so the handler below can fill it in
+        result = []
+
+        # An event that is set once the predicate is satisfied
+        satisfied = asyncio.Event()
+
+        def on_robot_state(evt, **kwargs):
+            # Don't bother once we have an answer
+            if satisfied.is_set():
+                return
+
+            # Take a pitch reading
+            pitch = abs(robot.pose_pitch.degrees)
+
+            if predicate(pitch):
+                result.append(pitch)
+                satisfied.set()
+
+        # Check each robot state update as it comes in from the SDK
+        # This is how pose_pitch gets refreshed, so polling any faster would not help
+        handler = robot.add_event_handler(cozmo.robot.EvtRobotStateUpdated, on_robot_state)
+
+        try:
+            await asyncio.wait_for(satisfied.wait(), timeout)
+        except asyncio.TimeoutError:
+            return None
+        finally:
+            # Stop listening for robot state updates
+            handler.disable()
+
+        return result[0]
+
+    @staticmethod
+    def _charger_return_alignment(robot_pos: Tuple[float, float, float],
+                                  charger_pos: Tuple[float, float, float],
+                                  charger_dir: Tuple[float, float],
+                                  charger_distance: float) -> Tuple[float, float]:
+        """
+        Locate the virtual target in front of the charger relative to a robot.
+
+        The robot and charger share the table plane, so only the XY components
+        are considered. Any Z difference is just noise in the poses.
+
+        :param robot_pos: The robot position
+        :param charger_pos: The charger position
+        :param charger_dir: The unit vector the charger faces along in the XY plane
+        :param charger_distance: The distance of the target in front of the charger
+        :return: The distance and direction (in radians) from the robot to the target
+        """
+
+        # Vector going from robot's origin to target's position
+        # The target sits out in front of the charger; this coordinate space is in Cozmo's head
+        vec_x = charger_pos[0] - charger_distance * charger_dir[0] - robot_pos[0]
+        vec_y = charger_pos[1] - charger_distance * charger_dir[1] - robot_pos[1]
+
+        return math.hypot(vec_x, vec_y), math.atan2(vec_y, vec_x)
+
     @staticmethod
     def _charger_return_wrap_radians(angle: float):
-        while angle >= 2 * math.pi:
-            angle -= 2 * math.pi
-        while angle <= -2 * math.pi:
+        # Most angles are already in range
+        if -math.pi < angle <= math.pi:
+            return angle
+
+        # Shift so the range starts at zero, reduce, and shift back
+        # The fmod result takes the sign of its input, so fix up negatives
+        angle = math.fmod(angle + math.pi, 2 * math.pi)
+        if angle < 0:
             angle += 2 * math.pi
 
-        if angle > math.pi:
-            angle -= 2 * math.pi
-        elif angle < -math.pi:
-            angle += 2 * math.pi
+        return angle - math.pi
 
-        return angle
+    def _take_cancel(self, index: int) -> bool:
+        """
+        Check for a pending cancel request on a robot and clear it.
 
-    async def _do_convo(self, index: int, robot: cozmo.robot.Robot):
+        :param index: The robot index
+        :return: True if a cancel was requested, otherwise False
         """
-        Action for carrying out a conversation.
 
-        Data:
-          - name (str) The conversation name
+        # Get the cancel event
+        cancel = self._slots[index - 1].cancel
+
+        # If it's not set, there's nothing to do
+        if not cancel.is_set():
+            return False
+
+        # Reset the cancel event
+        cancel.clear()
+
+        return True
+
+    async def _wait_unless_cancelled(self, index: int, fut: asyncio.Future) -> bool:
+        """
+        Wait for a future to complete unless a cancel request on a robot comes first.
+
+        :param index: The robot index
+        :param fut: The future
+        :return: True if a cancel was requested, otherwise False
+        """
+
+        # Wait on the cancel event alongside the future
+        # Whichever finishes first wakes us up
+        cancel_wait = asyncio.ensure_future(self._slots[index - 1].cancel.wait())
+        try:
+            await asyncio.wait({fut, cancel_wait}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            # We no longer need the cancel wait
+            cancel_wait.cancel()
+
+        return self._take_cancel(index)
+
+    async def _do_convo(self, index: int, robot: cozmo.robot.Robot, name: str):
+        """
+        Action for carrying out a conversation.
 
         :param index: The robot index
         :param robot: The robot instance
+        :param name: The conversation name
         """
 
+        # Get the slot for this robot
+        slot = self._slots[index - 1]
+
         # Convert robot index to robot letter
-        letter = 'A' if index == 1 else 'B'
+        letter = slot.letter
 
         self._tprint(f'Robot {letter} is engaging in conversation')
 
         # Turn toward other Cozmo
         # TODO: Use the index to determine angle to look at other Cozmo
-        await robot.turn_in_place(cozmo.util.degrees(180)).wait_for_completed()
-
-        # Get the requested conversation
-        name = None
-        if index == 1:
-            name = self._robot_queue_a.get()
-        elif index == 2:
-            name = self._robot_queue_b.get()
+        await robot.turn_in_place(_TURN_AROUND).wait_for_completed()
 
         self._tprint(f'Requested conversation {name}')
 
         # Load the conversation
-        convo = self._service_convo.load(name)
+        # This reads the script from disk and looks up names in the database, so keep it off the event loop
+        convo = await self._loop.run_in_executor(self._executor_db, self._service_convo.load, name)
 
         if convo is None:
             # Uh oh! That conversation does not exist...
@@ -1069,33 +1154,14 @@ class OperationInteract(Operation):
             fut = asyncio.ensure_future(convo.perform(
                 # One of these may be None, but that's okay
                 # The service will take care of handling that
-                robot_a=self._robot_a,
-                robot_b=self._robot_b,
+                robot_a=self._slots[0].robot,
+                robot_b=self._slots[1].robot,
             ))
 
-            # While the conversation is in progress
-            while not fut.done():
-                # Get the cancel state
-                cancel = None
-                if index == 1:
-                    cancel = self._cancel_a
-                elif index == 2:
-                    cancel = self._cancel_b
-
-                # Handle cancelling
-                if cancel:
-                    self._tprint('Conversation cancelling')
-
-                    # Reset the cancel state
-                    if index == 1:
-                        self._cancel_a = False
-                    elif index == 2:
-                        self._cancel_b = False
-
-                    break
-
-                # Yield control
-                await asyncio.sleep(0)
+            # Wait for the conversation to finish
+            # Handle cancelling
+            if await self._wait_unless_cancelled(index, fut):
+                self._tprint('Conversation cancelling')
 
             # Cancel the future
             # This forces a hard stop on the conversation
@@ -1109,8 +1175,11 @@ class OperationInteract(Operation):
         :param robot: The robot instance
         """
 
+        # Get the slot for this robot
+        slot = self._slots[index - 1]
+
         # Convert robot index to robot letter
-        letter = 'A' if index == 1 else 'B'
+        letter = slot.letter
 
         self._tprint(f'Robot {letter} is engaging in freeplay')
 
@@ -1118,28 +1187,12 @@ class OperationInteract(Operation):
         robot.start_freeplay_behaviors()
 
         # Sleep during freeplay
-        while True:
-            # Get the cancel state
-            cancel = None
-            if index == 1:
-                cancel = self._cancel_a
-            elif index == 2:
-                cancel = self._cancel_b
+        # Only a cancel ends it
+        await slot.cancel.wait()
 
-            # Handle cancelling
-            if cancel:
-                self._tprint('Freeplay cancelling')
-
-                # Reset the cancel state
-                if index == 1:
-                    self._cancel_a = False
-                elif index == 2:
-                    self._cancel_b = False
-
-                break
-
-            # Yield control
-            await asyncio.sleep(0)
+        # Handle cancelling
+        if self._take_cancel(index):
+            self._tprint('Freeplay cancelling')
 
         # Stop freeplay mode
         robot.stop_freeplay_behaviors()
@@ -1158,13 +1211,16 @@ class OperationInteract(Operation):
         :param robot: The robot instance
         """
 
+        # Get the slot for this robot
+        slot = self._slots[index - 1]
+
         # Convert robot index to robot letter
-        letter = 'A' if index == 1 else 'b'
+        letter = slot.letter
 
         self._tprint(f'Robot {letter} is engaging in pong')
 
         # Look upward
-        await robot.set_head_angle(cozmo.util.degrees(45)).wait_for_completed()
+        await robot.set_head_angle(_PONG_HEAD_ANGLE).wait_for_completed()
 
         over = False
 
@@ -1180,54 +1236,42 @@ class OperationInteract(Operation):
         p1_x = 5
         p2_x = 123
 
+        # The face image and its drawing context
+        # We redraw into these every tick instead of making new ones
+        face = Image.new('RGBA', (128, 64), (0, 0, 0, 255))
+        draw = ImageDraw.Draw(face)
+
+        # Get the cancel event for this robot
+        # We check it every tick, so look it up just once
+        cancel = slot.cancel
+
         # Hear ye
         await robot.say_text("I'm bored, I will play some pong").wait_for_completed()
 
         # While the game is not over
         while not over:
-            # Get the cancel state
-            cancel = None
-            if index == 1:
-                cancel = self._cancel_a
-            elif index == 2:
-                cancel = self._cancel_b
-
             # Handle cancelling
-            if cancel:
+            if cancel.is_set():
                 self._tprint('Pong cancelling')
 
-                # Reset the cancel state
-                if index == 1:
-                    self._cancel_a = False
-                elif index == 2:
-                    self._cancel_b = False
+                # Reset the cancel event
+                cancel.clear()
 
                 break
 
-            # Update paddles based on ball position and velocity
-            p1_y = self._pong_compute_paddle_y(ball_x, ball_y, ball_vel_x, ball_vel_y)
-            p2_y = self._pong_compute_paddle_y(ball_x, ball_y, ball_vel_x, ball_vel_y)
-
-            # Reflect ball of top of screen
-            if ball_y <= 2:
-                ball_vel_y = ball_vel_y * -1
+            # Update paddles based on ball position
+            # Set paddle heights to ball height with a random slop for effect
+            p1_y = ball_y + random.randint(-5, 5)
+            p2_y = ball_y + random.randint(-5, 5)
 
-            # Reflect ball off bottom of screen
-            if ball_y > 61:
-                ball_vel_y = ball_vel_y * -1
+            # Advance the ball
+            ball_x, ball_y, ball_vel_x, ball_vel_y, impacted = self._pong_step(ball_x, ball_y, ball_vel_x, ball_vel_y,
+                                                                               p1_x, p1_y, p2_x, p2_y)
 
-            # If ball is to the left of paddle 1
-            # This would indicate possible impact or win
-            if p1_x >= ball_x >= 0:
-                ball_vel_x, ball_vel_y = self._pong_check_impact(ball_x, ball_y, ball_vel_x, ball_vel_y, p1_y, robot)
-
-            # If ball is to the right of paddle 2
-            # This would indicate possible impact or win
-            if p2_x <= ball_x <= 128:
-                ball_vel_x, ball_vel_y = self._pong_check_impact(ball_x, ball_y, ball_vel_x, ball_vel_y, p2_y, robot)
-
-            ball_x += ball_vel_x
-            ball_y += ball_vel_y
+            # If the ball hit a paddle
+            if impacted:
+                # Play the impact sound effect
+                robot.play_audio(cozmo.audio.AudioEvents.SfxGameWin)
 
             # If ball passed a paddle
             if ball_x < 0 or ball_x > 130:
@@ -1244,7 +1288,7 @@ class OperationInteract(Operation):
                 over = True
 
             # Update the face image
-            face = self._pong_draw_face(0, 0, ball_x, ball_y, p1_x, p1_y, p2_x, p2_y)
+            self._pong_draw_face(draw, ball_x, ball_y, p1_x, p1_y, p2_x, p2_y)
 
             # Convert face image to screen
             screen = cozmo.oled_face.convert_image_to_screen_data(face)
@@ -1256,18 +1300,12 @@ class OperationInteract(Operation):
             await asyncio.sleep(0.02)
 
         # Set completion flag
-        self._complete = True
-
-    def _pong_compute_paddle_y(self, ball_x, ball_y, ball_vel_x, ball_vel_y):
-        # Set paddle height to ball height with a random slop for effect
-        return ball_y + random.randint(-5, 5)
-
-    def _pong_draw_face(self, x, y, ball_x, ball_y, p2_x, p2_y, p1_x, p1_y):
-        # The new face image
-        face = Image.new('RGBA', (128, 64), (0, 0, 0, 255))
+        self._complete.set()
 
-        # Drawing context
-        draw = ImageDraw.Draw(face)
+    @staticmethod
+    def _pong_draw_face(draw, ball_x, ball_y, p2_x, p2_y, p1_x, p1_y):
+        # Clear the face image
+        draw.rectangle([0, 0, 128, 64], fill=(0, 0, 0, 255))
 
         # Draw ball
         draw.ellipse([ball_x - 5, ball_y - 5, ball_x + 5, ball_y + 5], fill=(255, 255, 255, 255))
@@ -1278,14 +1316,40 @@ class OperationInteract(Operation):
         # Draw paddle 2 (right)
         draw.rectangle([p2_x - 3, p2_y - 10, p2_x, p2_y + 10], fill=(255, 255, 255, 255))
 
-        return face
+    @staticmethod
+    def _pong_step(ball_x, ball_y, ball_vel_x, ball_vel_y, p1_x, p1_y, p2_x, p2_y):
+        """
+        Advance the pong ball by one tick.
+
+        This is pure arithmetic, so the caller takes care of any sound effects.
+
+        :return: The new ball position, the new ball velocity, and whether the ball hit a paddle
+        """
+
+        # Reflect ball off top or bottom of screen
+        if ball_y <= 2 or ball_y > 61:
+            ball_vel_y = -ball_vel_y
+
+        impacted = False
+
+        # If ball is to the left of paddle 1
+        # This would indicate possible impact or win
+        if p1_x >= ball_x >= 0:
+            ball_vel_x, ball_vel_y, impacted = OperationInteract._pong_check_impact(ball_x, ball_y, ball_vel_x,
+                                                                                    ball_vel_y, p1_y)
+
+        # If ball is to the right of paddle 2
+        # This would indicate possible impact or win
+        elif p2_x <= ball_x <= 128:
+            ball_vel_x, ball_vel_y, impacted = OperationInteract._pong_check_impact(ball_x, ball_y, ball_vel_x,
+                                                                                    ball_vel_y, p2_y)
 
-    def _pong_check_impact(self, ball_x, ball_y, ball_vel_x, ball_vel_y, paddle_y, robot):
+        return ball_x + ball_vel_x, ball_y + ball_vel_y, ball_vel_x, ball_vel_y, impacted
+
+    @staticmethod
+    def _pong_check_impact(ball_x, ball_y, ball_vel_x, ball_vel_y, paddle_y):
         # If the ball hit the paddle (within y-tolerance)
         if abs(paddle_y - ball_y) < 10:
-            # Play the impact sound effect
-            robot.play_audio(cozmo.audio.AudioEvents.SfxGameWin)
-
             ball_vel_x = ball_vel_x * -1
             ball_vel_y += (0.5 * (ball_y - paddle_y))
 
@@ -1295,7 +1359,9 @@ class OperationInteract(Operation):
             # ball_vel_x = max([min([ball_vel_x * (float(random.randrange(9, 11)) / 10), 2]), 0.5])
             ball_vel_x = ball_vel_x * 1.1
 
-        return ball_vel_x, ball_vel_y
+            return ball_vel_x, ball_vel_y, True
+
+        return ball_vel_x, ball_vel_y, False
 
     async def _do_meet_and_greet(self, index: int, robot: cozmo.robot.Robot):
         """
@@ -1305,17 +1371,16 @@ class OperationInteract(Operation):
         :param robot: The robot instance
         """
 
+        # Get the slot for this robot
+        slot = self._slots[index - 1]
+
         # Convert robot index to robot letter
-        letter = 'A' if index == 1 else 'B'
+        letter = slot.letter
 
         self._tprint(f'Robot {letter} is engaging in greeting')
 
         # Get the robot-specific services
-        service_face = None
-        if index == 1:
-            service_face = self._service_face_a
-        elif index == 2:
-            service_face = self._service_face_b
+        service_face = slot.service_face
 
         # Tilt the head upward to look for faces
         await robot.set_head_angle(cozmo.robot.MAX_HEAD_ANGLE).wait_for_completed()
@@ -1324,56 +1389,23 @@ class OperationInteract(Operation):
         while not self._almost_stopping and not broken:
             self._tprint('Waiting to detect a face')
 
-            # Get the cancel state
-            cancel = None
-            if index == 1:
-                cancel = self._cancel_a
-            elif index == 2:
-                cancel = self._cancel_b
-
             # Handle cancelling
-            if cancel:
+            if self._take_cancel(index):
                 self._tprint('Meet and greet cancelling')
 
-                # Reset the cancel state
-                if index == 1:
-                    self._cancel_a = False
-                elif index == 2:
-                    self._cancel_b = False
-
                 broken = True
                 break
 
             # Submit a work order to detect a face (on a background thread)
-            # Keeping it in concurrent future form will let us cancel it easily
             face_det_future = service_face.next_track()
 
-            # While detection is not done
-            while not face_det_future.done():
-                # Get the cancel state
-                cancel = None
-                if index == 1:
-                    cancel = self._cancel_a
-                elif index == 2:
-                    cancel = self._cancel_b
-
-                # Handle cancelling
-                if cancel:
-                    self._tprint('Meet and greet cancelling')
-
-                    # Reset the cancel state
-                    if index == 1:
-                        self._cancel_a = False
-                    elif index == 2:
-                        self._cancel_b = False
-
-                    broken = True
-                    break
-
-                # Yield control
-                await asyncio.sleep(0)
+            # Wait for detection to be done
+            # We never cancel the detection future itself, as the face service completes it from its own thread
+            # Handle cancelling
+            if await self._wait_unless_cancelled(index, asyncio.wrap_future(face_det_future)):
+                self._tprint('Meet and greet cancelling')
 
-            if broken:
+                broken = True
                 break
 
             # The detected face
@@ -1388,7 +1420,7 @@ class OperationInteract(Operation):
             # This is a 4-tuple of the form (left, top, right, and bottom) with int components
             face_coords = face_det.coords
 
-            self._tprint(f'Detected face {face_index} at {face_coords}')
+            _log.debug('Detected face %d at %s', face_index, face_coords)
 
             # TODO: Center on the face
 
@@ -1408,7 +1440,7 @@ class OperationInteract(Operation):
             # This is a 128-tuple of doubles for the face vector (AKA encoding, embedding, descriptor, etc.)
             face_ident = face_rec.ident
 
-            self._tprint(f'Recognized face {face_index} at {face_coords} as ID {face_id}')
+            _log.debug('Recognized face %d at %s as ID %d', face_index, face_coords, face_id)
 
             if face_id == -1:
                 self._tprint('We do not know this face')
@@ -1416,8 +1448,11 @@ class OperationInteract(Operation):
                 # Get the name of the face
                 # This is implemented as console input
                 name = 'Bob'
-                self._prompted_name = True
-                self._prompted_name_response = None
+                self._prompted_name_event.clear()
+                with self._prompted_name_lock:
+                    self._prompted_name = True
+                    self._prompted_name_response = None
+
                 with self._term.terminal_lock:
                     # Ask for a name
                     self._term.async_update_prompt('(please type your name) ')
@@ -1432,18 +1467,42 @@ class OperationInteract(Operation):
                     await robot.say_text('I don\'t know you. Please type your name.').wait_for_completed()
 
                 # Wait for the prompt to come back
-                while True:
-                    with self._prompted_name_lock:
-                        if not self._prompted_name:
-                            name = self._prompted_name_response
-                            break
-                    await asyncio.sleep(0)
+                # Give up if we are cancelled or asked to stop in the meantime
+                name_wait = asyncio.ensure_future(self._prompted_name_event.wait())
+                cancel_wait = asyncio.ensure_future(slot.cancel.wait())
+                stop_wait = asyncio.ensure_future(self._stop_event.wait())
+                try:
+                    await asyncio.wait({name_wait, cancel_wait, stop_wait}, return_when=asyncio.FIRST_COMPLETED)
+                finally:
+                    # We no longer need any of the waits
+                    name_wait.cancel()
+                    cancel_wait.cancel()
+                    stop_wait.cancel()
+
+                # Take the name if it came back, otherwise withdraw the prompt
+                with self._prompted_name_lock:
+                    answered = not self._prompted_name
+                    self._prompted_name = False
+                    name = self._prompted_name_response or name
+
+                # If we gave up waiting
+                if not answered or self._take_cancel(index):
+                    if not answered:
+                        with self._term.terminal_lock:
+                            # Restore the prompt
+                            self._term.async_update_prompt('(cozmo) ')
+
+                    self._tprint('Meet and greet cancelling')
+
+                    broken = True
+                    break
 
                 # Encode the identity to a string for storage in the database
                 face_ident_enc = self._face_ident_encode(face_ident)
 
                 # Insert face into the database and get the assigned face ID (thanks Herman, this is easy to use)
-                face_id = database.insertNewStudent(name, face_ident_enc)
+                face_id = await self._loop.run_in_executor(self._executor_db, database.insertNewStudent,
+                                                           name, face_ident_enc)
 
                 # The database update has completed
                 self._tprint('Database update completed')
@@ -1451,8 +1510,8 @@ class OperationInteract(Operation):
                 # Add identity to both Cozmo A and B face services
                 # This lets us recognize this face again in the same session
                 # On subsequent sessions, we'll read from the database
-                self._service_face_a.add_identity(face_id, face_ident)
-                self._service_face_b.add_identity(face_id, face_ident)
+                for other_slot in self._slots:
+                    other_slot.service_face.add_identity(face_id, face_ident)
 
                 # Repeat the name
                 num = random.randrange(3)
@@ -1465,11 +1524,9 @@ class OperationInteract(Operation):
             else:
                 self._tprint('We know this face')
 
-                # Get name and time last seen for this face
-                name, time_last_seen = database.determineStudent(face_id)
-
-                # Update time last seen for face
-                database.checkForStudent(face_id)
+                # Get name and time last seen for this face and update time last seen in one go
+                name, time_last_seen = await self._loop.run_in_executor(self._executor_db, database.touchStudent,
+                                                                        face_id)
 
                 # Print time last seen
                 self._tprint(f'This face was last seen at {time_last_seen}')
@@ -1486,18 +1543,48 @@ class OperationInteract(Operation):
                     await robot.say_text(f'Good to see you, {name}!').wait_for_completed()
 
     @staticmethod
-    def _face_ident_decode(ident_enc: str) -> Tuple[float, ...]:
+    def _face_ident_is_json(ident_enc: str) -> bool:
         """
-        Decode a string-encoded face identity.
+        Check if a string-encoded face identity is in the older JSON format.
+
+        Older rows hold the 128-tuple of floats as JSON. Newer rows hold the
+        128 little-endian 32-bit floats in base64.
 
         :param ident_enc: The encoded identity
-        :return: The decoded identity
+        :return: True if such is the case, otherwise False
         """
 
-        # Load the 128-tuple of floats from JSON
-        ident = json.loads(ident_enc)
+        # A JSON list starts with a bracket, which never appears in base64
+        return ident_enc.startswith('[')
+
+    @classmethod
+    def _face_idents_decode(cls, idents_enc: List[str]) -> numpy.ndarray:
+        """
+        Decode many string-encoded face identities at once.
+
+        :param idents_enc: The encoded identities
+        :return: The decoded identities (one per row)
+        """
+
+        # The decoded identities
+        idents = numpy.empty((len(idents_enc), 128), dtype=numpy.float32)
+
+        # Rows holding older JSON-encoded identities and newer packed ones
+        is_json = [cls._face_ident_is_json(ident_enc) for ident_enc in idents_enc]
+        rows_json = [i for i, row_is_json in enumerate(is_json) if row_is_json]
+        rows_packed = [i for i, row_is_json in enumerate(is_json) if not row_is_json]
 
-        return ident
+        # Parse all the JSON ones with a single call
+        # Gluing the arrays together like this is much quicker than parsing them one by one
+        if rows_json:
+            idents[rows_json] = json.loads('[' + ','.join(idents_enc[i] for i in rows_json) + ']')
+
+        # Unpack all the packed ones from one buffer
+        if rows_packed:
+            packed = b''.join(base64.b64decode(idents_enc[i]) for i in rows_packed)
+            idents[rows_packed] = numpy.frombuffer(packed, dtype='<f4').reshape(-1, 128)
+
+        return idents
 
     @staticmethod
     def _face_ident_encode(ident: Tuple[float, ...]) -> str:
@@ -1508,10 +1595,14 @@ class OperationInteract(Operation):
         :return: The encoded identity
         """
 
-        # Dump the 128-tuple of floats into JSON
-        ident_json = json.dumps(ident)
+        # Pack the 128-tuple into little-endian 32-bit floats
+        # This is far smaller and quicker to load than JSON text
+        ident_bin = numpy.asarray(ident, dtype='<f4').tobytes()
+
+        # The database column holds text, so base64 the packed floats
+        ident_b64 = base64.b64encode(ident_bin).decode('ascii')
 
-        return ident_json
+        return ident_b64
 
     async def _do_return_to_waypoint(self, index: int, robot: cozmo.robot.Robot):
         """
@@ -1521,21 +1612,35 @@ class OperationInteract(Operation):
         :param robot: The robot instance
         """
 
+        # Get the slot for this robot
+        slot = self._slots[index - 1]
+
         # Convert robot index to robot letter
-        letter = 'A' if index == 1 else 'B'
+        letter = slot.letter
 
         self._tprint(f'Robot {letter} is returning to waypoint')
 
         # Get the robot waypoint
-        waypoint = None
-        if index == 1:
-            waypoint = self._robot_waypoint_a
-        elif index == 2:
-            waypoint = self._robot_waypoint_b
+        waypoint = slot.waypoint
 
         # Return to the saved waypoint (based on Eric's routine)
         await robot.go_to_pose(waypoint).wait_for_completed()
 
+    # The actions that carry out each allowed state transition
+    # Keys are (current state, next state) and values are unbound action methods
+    _TRANSITIONS: Dict[Tuple[_RobotState, _RobotState], Callable] = {
+        (_RobotState.home, _RobotState.waypoint): _do_drive_from_charger_to_waypoint,
+        (_RobotState.waypoint, _RobotState.home): _do_drive_from_waypoint_to_charger,
+        (_RobotState.waypoint, _RobotState.convo): _do_convo,
+        (_RobotState.waypoint, _RobotState.greet): _do_meet_and_greet,
+        (_RobotState.waypoint, _RobotState.freeplay): _do_freeplay,
+        (_RobotState.waypoint, _RobotState.pong): _do_pong,
+        (_RobotState.convo, _RobotState.waypoint): _do_return_to_waypoint,
+        (_RobotState.greet, _RobotState.waypoint): _do_return_to_waypoint,
+        (_RobotState.freeplay, _RobotState.waypoint): _do_return_to_waypoint,
+        (_RobotState.pong, _RobotState.waypoint): _do_return_to_waypoint,
+    }
+
     async def _choreographer(self):
         """
         The choreographer gives high-level commands to one or two robots.
@@ -1551,18 +1656,17 @@ class OperationInteract(Operation):
         # The idle flag
         idle = False
 
-        # The current chosen queue
-        queue_choice = None
+        # The names of all available conversations
+        # These don't change over a session, so we list them once
+        convo_names = self._service_convo.list()
 
-        while not self._almost_stopping:
-            # Get the queue for the chosen robot
-            if choice == 1:  # Chosen A
-                queue_choice = self._robot_queue_a
-            elif choice == 2:  # Chosen B
-                queue_choice = self._robot_queue_b
+        # When the next random activity is due
+        # Activities come along at random, about once every 90 minutes on average
+        next_activity_at = time.monotonic() + random.expovariate(1 / 5400)
 
-            queue_choice.put(_RobotState.waypoint)
-            queue_choice.put(_RobotState.greet)
+        while not self._almost_stopping:
+            self._put_robot_state(choice, _RobotState.waypoint)
+            self._put_robot_state(choice, _RobotState.greet)
 
             while self._is_battery_good(choice):
                 # This is an override point
@@ -1571,38 +1675,35 @@ class OperationInteract(Operation):
 
                 if idle:
                     self._swap = False
-                    queue_choice.put(_RobotState.waypoint)
-                    queue_choice.put(_RobotState.greet)
+                    self._put_robot_state(choice, _RobotState.waypoint)
+                    self._put_robot_state(choice, _RobotState.greet)
                     idle = False
 
-                # Pick a random activity
-                rand_activity = random.randrange(1, 162000)  # Something every 90 minutes on average
+                # Pick a random activity if one is due
+                rand_activity = 0
+                if time.monotonic() >= next_activity_at:
+                    rand_activity = random.randrange(1, 4)
+
+                    # Schedule the one after
+                    next_activity_at = time.monotonic() + random.expovariate(1 / 5400)
 
                 if rand_activity == 1:
                     self._tprint('Going to do conversation')
 
                     # Cancel greeting
-                    if choice == 1:  # Chosen A
-                        self._cancel_a = True
-                    elif choice == 2:  # Chosen B
-                        self._cancel_b = True
+                    self._slots[choice - 1].cancel.set()
 
                     # Clear complete flag
-                    self._complete = False
+                    self._complete.clear()
 
-                    queue_choice.put(_RobotState.waypoint)
-                    queue_choice.put(_RobotState.convo)
+                    self._put_robot_state(choice, _RobotState.waypoint)
 
                     # Pick a random conversation
-                    convos = self._service_convo.list()
-                    convo_num = random.randrange(1, len(convos))
-                    convo_name = convos[convo_num]
-                    queue_choice.put(convo_name)
+                    convo_name = random.choice(convo_names)
+                    self._put_robot_state(choice, _RobotState.convo, convo_name)
 
                     # While conversation is running
-                    while not self._almost_stopping and self._is_battery_good(choice) and not self._complete:
-                        # Yield control
-                        await asyncio.sleep(0)
+                    await self._wait_for_complete(choice)
 
                     # Set idle flag
                     idle = True
@@ -1616,21 +1717,16 @@ class OperationInteract(Operation):
                     self._tprint('Going to do pong')
 
                     # Cancel greeting
-                    if choice == 1:  # Chosen A
-                        self._cancel_a = True
-                    elif choice == 2:  # Chosen B
-                        self._cancel_b = True
+                    self._slots[choice - 1].cancel.set()
 
                     # Clear complete flag
-                    self._complete = False
+                    self._complete.clear()
 
-                    queue_choice.put(_RobotState.waypoint)
-                    queue_choice.put(_RobotState.pong)
+                    self._put_robot_state(choice, _RobotState.waypoint)
+                    self._put_robot_state(choice, _RobotState.pong)
 
                     # While pong is running
-                    while not self._almost_stopping and self._is_battery_good(choice) and not self._complete:
-                        # Yield control
-                        await asyncio.sleep(0)
+                    await self._wait_for_complete(choice)
 
                     # Set idle flag
                     idle = True
@@ -1644,31 +1740,20 @@ class OperationInteract(Operation):
                     self._tprint('Going to do freeplay')
 
                     # Cancel greeting
-                    if choice == 1:  # Chosen A
-                        self._cancel_a = True
-                    elif choice == 2:  # Chosen B
-                        self._cancel_b = True
+                    self._slots[choice - 1].cancel.set()
 
                     # Clear complete flag
-                    self._complete = False
+                    self._complete.clear()
 
-                    queue_choice.put(_RobotState.waypoint)
-                    queue_choice.put(_RobotState.freeplay)
+                    self._put_robot_state(choice, _RobotState.waypoint)
+                    self._put_robot_state(choice, _RobotState.freeplay)
 
                     # While the freeplay mode is running
-                    start = time.clock()
-                    while not self._almost_stopping and self._is_battery_good(choice):
-                        if time.clock() - start > 20:  # Only stay in freeplay for twenty seconds
-                            break
-
-                        # Yield control
-                        await asyncio.sleep(0)
+                    # Only stay in freeplay for twenty seconds
+                    await self._wait_for_complete(choice, timeout=20)
 
                     # Cancel freeplay
-                    if choice == 1:  # Chosen A
-                        self._cancel_a = True
-                    elif choice == 2:  # Chosen B
-                        self._cancel_b = True
+                    self._slots[choice - 1].cancel.set()
 
                     # Set idle flag
                     idle = True
@@ -1677,27 +1762,22 @@ class OperationInteract(Operation):
                     await self._wait_while_overridden()
 
                 # Clear the completion flag
-                self._complete = False
+                self._complete.clear()
 
                 # Sleep for a fixed time
                 await asyncio.sleep(0.1)  # Choreographer loops once every tenth of a second
 
             # Cancel greeting
-            if choice == 1:  # Chosen A
-                self._cancel_a = True
-            elif choice == 2:  # Chosen B
-                self._cancel_b = True
+            self._slots[choice - 1].cancel.set()
 
             # Clear complete flag
-            self._complete = False
+            self._complete.clear()
 
-            queue_choice.put(_RobotState.waypoint)
-            queue_choice.put(_RobotState.home)
+            self._put_robot_state(choice, _RobotState.waypoint)
+            self._put_robot_state(choice, _RobotState.home)
 
             # While driving to home
-            while not self._almost_stopping and self._is_battery_good(choice) and not self._complete:
-                # Yield control
-                await asyncio.sleep(0)
+            await self._wait_for_complete(choice)
 
             self._tprint('Choreographer detected driven to home')
 
@@ -1707,21 +1787,95 @@ class OperationInteract(Operation):
             elif choice == 2:
                 choice = 1
 
-        # Get the queue for the chosen robot
-        queue_choice = None
-        if choice == 1:  # Chosen A
-            queue_choice = self._robot_queue_a
-        elif choice == 2:  # Chosen B
-            queue_choice = self._robot_queue_b
-
-        queue_choice.put(_RobotState.waypoint)
-        queue_choice.put(_RobotState.home)
+        self._put_robot_state(choice, _RobotState.waypoint)
+        self._put_robot_state(choice, _RobotState.home)
 
         self._tprint('Choreographer has stopped')
 
         # Now we can tear down the low-level loops
         self._stopping = True
 
+        # Wake the drivers so they notice
+        for slot in self._slots:
+            slot.queue.put_nowait(None)
+
+    def _put_robot_state(self, index: int, state: _RobotState, *args):
+        """
+        Enqueue a state on the state queue for a robot.
+
+        This must be called on the event loop. Other threads should go through
+        call_soon_threadsafe().
+
+        :param index: The robot index
+        :param state: The state to go to
+        :param args: Arguments for the action that leads to the state
+        """
+
+        # Enqueue the state and its arguments as a single command
+        # That way, the arguments can never be mistaken for a state
+        self._slots[index - 1].queue.put_nowait((state, *args))
+
+    def _request_stop(self):
+        """
+        Request that the operation stop.
+
+        This must be called on the event loop. Other threads should go through
+        call_soon_threadsafe().
+        """
+
+        # Set the stop event
+        self._stop_event.set()
+
+    def _cancel_robot(self, index: int):
+        """
+        Request that the current activity on a robot cancel.
+
+        This must be called on the event loop. Other threads should go through
+        call_soon_threadsafe().
+
+        :param index: The robot index
+        """
+
+        # Set the cancel event for the robot
+        self._slots[index - 1].cancel.set()
+
+    async def _wait_for_complete(self, index: int, timeout: Optional[float] = None):
+        """
+        Wait for the current activity to complete.
+
+        This also returns early if the operation is stopping or the battery on
+        the robot runs low.
+
+        :param index: The robot index
+        :param timeout: The maximum time to wait (in seconds) or None for no limit
+        """
+
+        # Work against a fixed deadline on the loop clock
+        loop = asyncio.get_event_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+
+        # Wake up as soon as the activity completes or we are asked to stop
+        complete_wait = asyncio.ensure_future(self._complete.wait())
+        stop_wait = asyncio.ensure_future(self._stop_event.wait())
+
+        try:
+            while not complete_wait.done() and not stop_wait.done() and self._is_battery_good(index):
+                # There is no event for the battery, so check on it every so often
+                wait = _BATTERY_CHECK_PERIOD
+
+                # Don't sleep past the deadline
+                if deadline is not None:
+                    wait = min(wait, deadline - loop.time())
+                    if wait <= 0:
+                        break
+
+                # Sleep until something happens
+                await asyncio.wait({complete_wait, stop_wait}, timeout=wait, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            # Don't leave the waiters behind
+            complete_wait.cancel()
+            stop_wait.cancel()
+
     def _is_battery_good(self, index: int):
         """
         Test if the battery on a robot is good.
@@ -1731,11 +1885,7 @@ class OperationInteract(Operation):
         """
 
         # Get the battery potential
-        potential = 0
-        if index == 1:
-            potential = self._robot_a.battery_voltage
-        elif index == 2:
-            potential = self._robot_b.battery_voltage
+        potential = self._slots[index - 1].robot.battery_voltage
 
         # If the battery is good...
         return potential > 3.5
@@ -1766,8 +1916,9 @@ class OperationInteract(Operation):
                     if not self._override:
                         break
 
-                # Yield control
-                await asyncio.sleep(0)
+                # Check back in a tenth of a second
+                # The flag is flipped by hand from the terminal, so there's no need to spin
+                await asyncio.sleep(0.1)
 
         return was_overridden
 
@@ -1786,6 +1937,8 @@ class OperationInteract(Operation):
             return
 
         # Lock the terminal interface
+        # This must stay: async_alert() only tries the lock without blocking and raises if it's held
+        # cmd2 holds it while the prompt is not on screen, so taking it here waits our turn
         with self._term.terminal_lock:
             # Asynchronously print to the terminal
             # They call this an "alert" in cmd2
@@ -1815,8 +1968,8 @@ class InteractInterface(cmd2.Cmd):
         # Keep the operation
         self._op = op
 
-        # The selected robot index
-        self._selected_robot: int = None
+        # The selected robot index (zero if no robot is selected)
+        self._selected_robot: int = 0
 
         # Our own conversation service
         # We use this to offer tab completions
@@ -1836,22 +1989,16 @@ class InteractInterface(cmd2.Cmd):
         # Get the requested robot index
         self._selected_robot = self._robot_char_to_index(args.robot)
 
-        if self._selected_robot == 1:
-            print('Selected robot A')
-        elif self._selected_robot == 2:
-            print('Selected robot B')
-        else:
-            print('Deselected robot')
+        self.poutput(_SELECT_MESSAGES[self._selected_robot])
 
     def do_selected(self, args):
         """Query the selected robot."""
 
-        if self._selected_robot == 1:
-            print('Robot A is selected')
-        elif self._selected_robot == 2:
-            print('Robot B is selected')
-        else:
-            print('No robot selected')
+        # This command takes no arguments
+        if self._reject_args(args):
+            return
+
+        self.poutput(_SELECTED_MESSAGES[self._selected_robot])
 
     state_parser = argparse.ArgumentParser()
     state_parser.add_argument('robot', type=str, help='robot to query (a/b or 1/2, all else fails)')
@@ -1865,62 +2012,54 @@ class InteractInterface(cmd2.Cmd):
 
         # Get the robot state
         state = None
-        if index == 1:  # Robot A
+        if index:
             # noinspection PyProtectedMember
-            state = self._op._robot_state_a
-        elif index == 2:  # Robot B
-            # noinspection PyProtectedMember
-            state = self._op._robot_state_b
+            state = self._op._slots[index - 1].state
         else:
-            print(f'Invalid robot: "{args.robot}"')
+            self.poutput(f'Invalid robot: "{args.robot}"')
 
         # Print name and number of state
         if state is not None:
-            print(f'{state.value}: "{state.name}"')
+            self.poutput(f'{state.value}: "{state.name}"')
 
     def do_cancel(self, args):
         """Cancel the activity on the selected Cozmo robot."""
 
+        # This command takes no arguments
+        if self._reject_args(args):
+            return
+
         # Require a robot to be selected
-        if self._selected_robot is None:
-            print('No robot selected')
+        if not self._selected_robot:
+            self.poutput('No robot selected')
             return
 
-        print('Cancelling the activity')
+        self.poutput('Cancelling the activity')
 
-        # Set the appropriate cancel flag
-        if self._selected_robot == 1:  # Robot A
-            # noinspection PyProtectedMember
-            self._op._cancel_a = True
-        elif self._selected_robot == 2:  # Robot B
-            # noinspection PyProtectedMember
-            self._op._cancel_b = True
+        # Set the appropriate cancel event
+        # The cancel events belong to the event loop on the interact thread, so hand the request over to it
+        # noinspection PyProtectedMember
+        self._call_on_loop(self._op._cancel_robot, self._selected_robot)
 
     def do_waypoint(self, args):
         """Drive the selected Cozmo to its waypoint."""
 
-        # Require a robot to be selected
-        if self._selected_robot is None:
-            print('No robot selected')
+        # This command takes no arguments
+        if self._reject_args(args):
             return
 
-        print('Attempting to drive to waypoint')
-
         # Go to waypoint state
-        self._get_robot_state_queue().put(_RobotState.waypoint)
+        self._do_activity(_RobotState.waypoint, 'Attempting to drive to waypoint')
 
     def do_home(self, args):
         """Drive the selected Cozmo from its waypoint to its charger."""
 
-        # Require a robot to be selected
-        if self._selected_robot is None:
-            print('No robot selected')
+        # This command takes no arguments
+        if self._reject_args(args):
             return
 
-        print('Attempting to return to charger')
-
         # Go to home state
-        self._get_robot_state_queue().put(_RobotState.home)
+        self._do_activity(_RobotState.home, 'Attempting to return to charger')
 
     convo_parser = argparse.ArgumentParser()
     convo_parser.add_argument('name', type=str, help='the conversation name')
@@ -1929,62 +2068,50 @@ class InteractInterface(cmd2.Cmd):
     def do_convo(self, args):
         """Start conversation activity."""
 
-        # Require a robot to be selected
-        if self._selected_robot is None:
-            print('No robot selected')
-            return
-
-        print('Attempting to start conversation activity')
-        print(f'Requesting conversation "{args.name}"')
-
         # Go to convo state
-        queue = self._get_robot_state_queue()
-        queue.put(_RobotState.convo)
-        queue.put(args.name)
+        # The conversation name follows the state
+        self._do_activity(_RobotState.convo,
+                          f'Attempting to start conversation activity\nRequesting conversation "{args.name}"',
+                          args.name)
 
     def do_greet(self, args):
         """Start meet and greet activity."""
 
-        # Require a robot to be selected
-        if self._selected_robot is None:
-            print('No robot selected')
+        # This command takes no arguments
+        if self._reject_args(args):
             return
 
-        print('Attempting to start meet and greet activity')
-
         # Go to greet state
-        self._get_robot_state_queue().put(_RobotState.greet)
+        self._do_activity(_RobotState.greet, 'Attempting to start meet and greet activity')
 
     def do_freeplay(self, args):
         """Start freeplay activity."""
 
-        # Require a robot to be selected
-        if self._selected_robot is None:
-            print('No robot selected')
+        # This command takes no arguments
+        if self._reject_args(args):
             return
 
-        print('Attempting to start freeplay activity')
-
         # Go to freeplay state
-        self._get_robot_state_queue().put(_RobotState.freeplay)
+        self._do_activity(_RobotState.freeplay, 'Attempting to start freeplay activity')
 
     def do_pong(self, args):
         """Start pong activity."""
 
-        # Require a robot to be selected
-        if self._selected_robot is None:
-            print('No robot selected')
+        # This command takes no arguments
+        if self._reject_args(args):
             return
 
-        print('Attempting to start pong activity')
-
-        # Go to freeplay state
-        self._get_robot_state_queue().put(_RobotState.pong)
+        # Go to pong state
+        self._do_activity(_RobotState.pong, 'Attempting to start pong activity')
 
     def do_swap(self, args):
         """Issue a manual swap."""
 
-        print('Attempting to swap the Cozmos')
+        # This command takes no arguments
+        if self._reject_args(args):
+            return
+
+        self.poutput('Attempting to swap the Cozmos')
 
         # Set the swap flag
         with self._op._swap_lock:
@@ -1993,7 +2120,11 @@ class InteractInterface(cmd2.Cmd):
     def do_override(self, args):
         """Toggle manual override."""
 
-        print('Toggling manual override')
+        # This command takes no arguments
+        if self._reject_args(args):
+            return
+
+        self.poutput('Toggling manual override')
 
         # Toggle the override flag
         with self._op._override_lock:
@@ -2009,6 +2140,10 @@ class InteractInterface(cmd2.Cmd):
                 self._op._prompted_name = False
                 self._op._prompted_name_response = str(statement.raw)
 
+                # Wake the greeting up
+                # noinspection PyProtectedMember
+                self._call_on_loop(self._op._prompted_name_event.set)
+
                 # Restore the prompt
                 self.prompt = '(cozmo) '
 
@@ -2017,18 +2152,63 @@ class InteractInterface(cmd2.Cmd):
 
         return statement
 
-    def _get_robot_state_queue(self):
-        """Get the state queue for the selected robot."""
+    def _reject_args(self, args) -> bool:
+        """
+        Complain if a command that takes no arguments was given some.
 
-        if self._selected_robot == 1:
-            # noinspection PyProtectedMember
-            return self._op._robot_queue_a
-        elif self._selected_robot == 2:
+        :param args: The command arguments
+        :return: True if there were arguments, otherwise False
+        """
+
+        if args:
+            self.perror('This command takes no arguments')
+            return True
+
+        return False
+
+    def _do_activity(self, state: _RobotState, message: str, *args):
+        """
+        Send the selected robot to an activity state.
+
+        :param state: The state to go to
+        :param message: The message to print
+        :param args: Arguments for the action that leads to the state
+        """
+
+        # Require a robot to be selected
+        if not self._selected_robot:
+            self.poutput('No robot selected')
+            return
+
+        self.poutput(message)
+
+        # Go to the state
+        self._put_robot_state(state, *args)
+
+    def _put_robot_state(self, state: _RobotState, *args):
+        """Enqueue a state on the state queue for the selected robot."""
+
+        # The state queues belong to the event loop on the interact thread, so hand the state over to it
+        # noinspection PyProtectedMember
+        self._call_on_loop(self._op._put_robot_state, self._selected_robot, state, *args)
+
+    def _call_on_loop(self, callback: Callable, *args):
+        """
+        Hand a call over to the event loop on the interact thread.
+
+        :param callback: The function to call
+        :param args: The arguments to call it with
+        """
+
+        try:
             # noinspection PyProtectedMember
-            return self._op._robot_queue_b
+            self._op._loop.call_soon_threadsafe(callback, *args)
+        except RuntimeError:
+            # The event loop is closed once the operation ends, so there is no one left to do this
+            self.perror('The interact operation has ended')
 
     @staticmethod
-    def _robot_char_to_index(char: any) -> int:
+    def _robot_char_to_index(char: str) -> int:
         """
         Convert a robot character (e.g. 'a', 'B', '1', etc.) to its index.
 
@@ -2038,12 +2218,7 @@ class InteractInterface(cmd2.Cmd):
         :return: The robot index
         """
 
-        if char == 'a' or char == 'A' or char == '1':
-            return 1
-        elif char == 'b' or char == 'B' or char == '2':
-            return 2
-        else:
-            return 0
+        return _ROBOT_CHAR_TO_INDEX.get(char, 0)
 
 
 # Stay on the charger during the connection process
@@ -35,19 +35,22 @@ def loadStudents():
 # Returns 'Studentid'
 def insertNewStudent(studentName, imageID):
 
-    insertStudent = """INSERT INTO Students(Name, Image) VALUES('%s', '%s')""" % (studentName, imageID)
-    myCursor.execute(insertStudent)
+    insertStudent = """INSERT INTO Students(Name, Image) VALUES(%s, %s)"""
+    myCursor.execute(insertStudent, (studentName, imageID))
     connection.commit()
     print("Insertion was a success...")
 
-    returnID = """SELECT Studentid FROM Students WHERE Name = '%s' AND Image = '%s'""" % (studentName, imageID)
-    myCursor.execute(returnID)
-    fetchID = myCursor.fetchall()
-    if fetchID is not None:
-       for x in fetchID:
-            print("Returning Student's ID..")
-            #print (x[0]) #will return studentID number ? switch orint with return
-            return(x[0])
+    # The new 'Studentid' comes straight back from the insert, so no need to look it up
+    print("Returning Student's ID..")
+    return myCursor.lastrowid
+
+# Replace the stored images of students with re-encoded ones;
+# Takes ('Studentid', imageID) pairs and commits them all at once
+def updateStudentImages(studentPairs):
+    updateImage = """UPDATE Students SET Image = %s WHERE Studentid = %s"""
+    myCursor.executemany(updateImage, [(imageID, studentID) for studentID, imageID in studentPairs])
+    connection.commit()
+    print("Updated", len(studentPairs), "student images")
 
 # If studentID seen by cozmo before, update the Date_seen
 def checkForStudent(studentID):
@@ -89,6 +92,20 @@ def listStudentIDs():
             #print(studID[0])
             return (studentPairs[0])
 
+# Look up the name and date last seen of a student, then update the Date_seen to now;
+# Returns the name and date last seen from before the update
+def touchStudent(studentID):
+    select = """SELECT Name, Date_seen FROM Students WHERE Studentid = %s"""
+    myCursor.execute(select, (studentID,))
+    student = myCursor.fetchone()
+
+    if student is not None:
+        updateExistingUser = """UPDATE Students SET Date_seen = NOW() WHERE Studentid = %s"""
+        myCursor.execute(updateExistingUser, (studentID,))
+        connection.commit()
+        print("Student with ID = ", studentID, "is ", student[0], "and date last seen is", student[1])
+        return student[0], student[1]
+
 # Based on 'Studentid' list the name and date last seen of that student
 def determineStudent(studentID):
     select = """SELECT Name, Date_seen FROM Students WHERE StudentID = '%s'""" % (studentID)
@@ -10,7 +10,7 @@ import sys
 from abc import abstractmethod, ABC
 from enum import Enum
 from functools import reduce
-from typing import List
+from typing import Dict, List
 
 import cozmo
 from pkg_resources import resource_filename
@@ -241,6 +241,10 @@ class ServiceConvo(Service):
     def __init__(self):
         super().__init__()
 
+        # Conversation data already read from disk, by name
+        # The files don't change over a session, so each one only needs to be read once
+        self._data: Dict[str, dict] = {}
+
     def start(self):
         """
         Start the Convo service.
@@ -275,30 +279,38 @@ class ServiceConvo(Service):
         :return: The conversation
         """
 
-        # Create the target file name for the conversation
-        filename = os.path.join(_data_directory, f'{name}.json')
+        # Get the conversation data if we've read it before
+        data = self._data.get(name)
+
+        if data is None:
+            # Create the target file name for the conversation
+            filename = os.path.join(_data_directory, f'{name}.json')
 
-        # Open the conversation file
-        with open(filename) as file:
-            # Load conversation data
-            data = json.load(file)
+            # Open the conversation file
+            with open(filename) as file:
+                # Load conversation data
+                data = json.load(file)
 
             # Sanity check name of conversation
             if not data.get('name') == name:
                 raise RuntimeError('conversation name mismatch')
 
-            # The loaded conversation action
-            actions = []
+            # Keep the data for next time
+            self._data[name] = data
 
-            # Load each action in the script
-            for action in data.get('script', []):
-                actions.append(self._load_action(action))
+        # The loaded conversation action
+        # These are built fresh every time, as they fill in the name of the last person seen
+        actions = []
 
-            # Create the conversation
-            return Conversation(
-                name=name,
-                actions=actions,
-            )
+        # Load each action in the script
+        for action in data.get('script', []):
+            actions.append(self._load_action(action))
+
+        # Create the conversation
+        return Conversation(
+            name=name,
+            actions=actions,
+        )
 
     def _load_action(self, data):
         """
@@ -7,7 +7,7 @@ import time
 from concurrent.futures import Future
 from concurrent.futures.thread import ThreadPoolExecutor
 from threading import Thread, Lock
-from typing import List, Tuple, Dict, Optional
+from typing import List, Tuple, Dict, Iterable, Optional
 
 import PIL.Image
 import cv2
@@ -117,9 +117,16 @@ class ServiceFace(Service):
         super().__init__()
 
         # The face identities
-        self._identities: Dict[int, Tuple[float, ...]] = {}
+        self._identities: Dict[int, numpy.ndarray] = {}
         self._identities_lock = Lock()
 
+        # The face identities stacked into a gallery matrix (one 128-dimensional row per face)
+        # This lets us match an unknown face against every known face in one go
+        # It is rebuilt whenever the identities change, which is rare compared to recognition
+        self._gallery_fids: List[int] = []
+        self._gallery = numpy.empty((0, 128), dtype=numpy.float32)
+        self._gallery_sq = numpy.empty((0,), dtype=numpy.float32)
+
         # The detection thread
         # We only need one of these, as each detection operation finds all faces in a frame
         # It would make no sense to parallelize detection across multiple frames simultaneously
@@ -159,7 +166,24 @@ class ServiceFace(Service):
 
         with self._identities_lock:
             # Map the identity
-            self._identities[fid] = ident
+            self._identities[fid] = numpy.asarray(ident, dtype=numpy.float32)
+
+            # Restack the gallery
+            self._rebuild_gallery()
+
+    def add_identities(self, identities: Iterable[Tuple[int, Tuple[float, ...]]]):
+        """
+        Add many new face identities to the tracker at once.
+
+        :param identities: Pairs of face IDs and face identities (128-dimensional vectors)
+        """
+
+        with self._identities_lock:
+            # Map all the identities
+            self._identities.update((fid, numpy.asarray(ident, dtype=numpy.float32)) for fid, ident in identities)
+
+            # Restack the gallery
+            self._rebuild_gallery()
 
     def remove_identity(self, fid: int):
         """
@@ -172,6 +196,23 @@ class ServiceFace(Service):
             # Unmap the identity
             del self._identities[fid]
 
+            # Restack the gallery
+            self._rebuild_gallery()
+
+    def _rebuild_gallery(self):
+        """
+        Rebuild the gallery matrix from the face identities.
+
+        The identities lock must be held.
+        """
+
+        # Stack the identities in a fixed order
+        self._gallery_fids = list(self._identities.keys())
+        self._gallery = numpy.array(list(self._identities.values()), dtype=numpy.float32).reshape(-1, 128)
+
+        # Precompute the squared norm of each row for distance computations
+        self._gallery_sq = numpy.einsum('ij,ij->i', self._gallery, self._gallery)
+
     def start(self):
         """
         Start the face service.
@@ -429,22 +470,31 @@ class ServiceFace(Service):
         print(f'Computed face embedding for tracker {index}; cross-referencing known faces...')
 
         with self._identities_lock:
-            # Details about the best match
-            best_match_fid = -1  # Impossible by our definition of face IDs (valid only if >= 0)
-            best_match_distance = 0.6  # TODO: Make this user configurable (the maximum tolerance)
-
-            for other_fid in self._identities.keys():
-                # The other full-blown identity (128-dim vector embedding)
-                other_ident = numpy.array(self._identities[other_fid])
-
-                # In numpy, the norm of two vectors with ord=None and axis=1 is simply Euclidean distance
-                distance = numpy.linalg.norm([ident - other_ident], ord=None, axis=1)
-
-                # If this is a new best distance
-                if distance < best_match_distance:
-                    # Update best match details
-                    best_match_fid = other_fid
-                    best_match_distance = distance
+            # Grab the current gallery
+            # It is replaced (never modified) on rebuild, so we can keep using it after unlocking
+            gallery_fids = self._gallery_fids
+            gallery = self._gallery
+            gallery_sq = self._gallery_sq
+
+        # Details about the best match
+        best_match_fid = -1  # Impossible by our definition of face IDs (valid only if >= 0)
+        best_match_distance = 0.6  # TODO: Make this user configurable (the maximum tolerance)
+
+        # If there are any known faces
+        if gallery_fids:
+            # The identity in the same precision as the gallery
+            query = ident.astype(numpy.float32)
+
+            # Squared Euclidean distance to every known face at once
+            # This expands |g - q|^2 as |g|^2 - 2 g.q + |q|^2 so the bulk of it is one matrix-vector product
+            distances_sq = gallery_sq - 2 * (gallery @ query) + query @ query
+
+            # The closest known face
+            best = int(distances_sq.argmin())
+
+            # If it's within tolerance, we have a match
+            if distances_sq[best] < best_match_distance ** 2:
+                best_match_fid = gallery_fids[best]
 
         print(f'Cross-referencing for tracker {index} completed')
 
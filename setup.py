@@ -51,6 +51,9 @@ setup(
         'opencv-python',
         'pillow',
     ],
+    extras_require={
+        'uvloop': ['uvloop'],
+    },
     classifiers=[
         'Programming Language :: Python',
         'Programming Language :: Python :: 3',